@@ -1,5 +1,17 @@
+import importlib
+
 from .utils import vertical_spacer, split_row
-from .data_viz import fema_nri_map, population_by_climate_region, national_risk_score, climate_hazards, socioeconomic_projections, plot_socioeconomic_indices, plot_socioeconomic_radar
+
+# Chart components pull in plotly and the database layer, so load them on first use
+_LAZY_COMPONENTS = {
+    "fema_nri_map": ".data_viz",
+    "population_by_climate_region": ".data_viz",
+    "national_risk_score": ".data_viz",
+    "climate_hazards": ".data_viz",
+    "socioeconomic_projections": ".data_viz",
+    "plot_socioeconomic_indices": ".data_viz",
+    "plot_socioeconomic_radar": ".data_viz",
+}
 
 __all__ = [
     "vertical_spacer",
@@ -12,3 +24,14 @@ __all__ = [
     "plot_socioeconomic_indices",
     "plot_socioeconomic_radar",
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY_COMPONENTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_COMPONENTS[name], __name__), name)
+
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
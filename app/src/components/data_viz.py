@@ -1,15 +1,12 @@
 import json
 import streamlit as st
 import pandas as pd
-import geopandas as gpd
-from shapely.ops import unary_union
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 
 from src.db import db as database, Table
 
-from shapely import wkt
 from urllib.request import urlopen
 
 
@@ -32,6 +29,20 @@ RISK_LEVELS = ['Very Low', 'Low', 'Moderate', 'High', 'Very High']
 # Map risk categories to colors
 RISK_COLOR_MAPPING = dict(zip(RISK_LEVELS, RISK_COLORS_RGB_STR))
 
+# Top hazards, sorted and bucketed into risk levels once at import
+HAZARDS_DF = pd.DataFrame({
+    "Hazard Type": ["Extreme Heat", "Drought", "Riverine Flooding", "Wildfire", "Hurricane"],
+    "Risk Score": [82.4, 64.7, 42.3, 37.8, 15.2]
+}).sort_values("Risk Score", ascending=False)
+
+# Create a color mapping based on risk score ranges
+HAZARDS_DF['Color Category'] = pd.cut(
+    HAZARDS_DF['Risk Score'],
+    bins=[0, 20, 40, 60, 80, 100],
+    labels=RISK_LEVELS,
+    include_lowest=True
+)
+
 
 def get_risk_color(score, opacity=1.0):
     """Get color for a risk score with specified opacity"""
@@ -91,26 +102,9 @@ def national_risk_score(county_fips):
 
 
 def climate_hazards(county_fips, county_name):
-    # Display top hazards
-    hazard_data = {
-        "Hazard Type": ["Extreme Heat", "Drought", "Riverine Flooding", "Wildfire", "Hurricane"],
-        "Risk Score": [82.4, 64.7, 42.3, 37.8, 15.2]
-    }
-
-    hazards_df = pd.DataFrame(hazard_data)
-    hazards_df = hazards_df.sort_values("Risk Score", ascending=False)
-
-    # Create a color mapping based on risk score ranges
-    hazards_df['Color Category'] = pd.cut(
-        hazards_df['Risk Score'],
-        bins=[0, 20, 40, 60, 80, 100],
-        labels=RISK_LEVELS,
-        include_lowest=True
-    )
-
-    # Create a horizontal bar chart
+    # Create a horizontal bar chart of the top hazards
     fig = px.bar(
-        hazards_df,
+        HAZARDS_DF,
         x="Risk Score",
         y="Hazard Type",
         orientation='h',
@@ -123,225 +117,271 @@ def climate_hazards(county_fips, county_name):
     st.plotly_chart(fig)
 
 
-def fema_nri_map(scenario):
-    try:
-        # Load county GeoJSON data
-        with urlopen('https://raw.githubusercontent.com/plotly/datasets/master/geojson-counties-fips.json') as response:
-            counties = json.load(response)
+@st.cache_data(ttl=86400, show_spinner=False)
+def _load_counties_geojson():
+    """Download the county boundaries GeoJSON once a day rather than on every rerun"""
+    with urlopen('https://raw.githubusercontent.com/plotly/datasets/master/geojson-counties-fips.json') as response:
+        return json.load(response)
 
-        # Load states GeoJSON data
-        with urlopen('https://raw.githubusercontent.com/PublicaMundi/MappingAPI/master/data/geojson/us-states.json') as response:
-            states_json = json.load(response)
 
-        # Extract the features list directly
-        states_features = states_json
+@st.cache_data(ttl=86400, show_spinner=False)
+def _load_states_geojson():
+    """Download the state boundaries GeoJSON once a day rather than on every rerun"""
+    with urlopen('https://raw.githubusercontent.com/PublicaMundi/MappingAPI/master/data/geojson/us-states.json') as response:
+        return json.load(response)
 
-        # Get county data and merge with population projections
-        counties_data = database.get_county_metadata()
-        counties_data = counties_data.merge(
-            database.get_population_projections_by_fips(),
-            how='inner',
-            on='COUNTY_FIPS'
-        )
 
-        # Get FEMA risk data
-        fema_df = database.get_stat_var(Table.COUNTY_FEMA_DATA, "FEMA_NRI",
-                                county_fips=counties_data['COUNTY_FIPS'].tolist(), year=2023)
-
-        # Merge FEMA data with counties data
-        counties_data = counties_data.merge(
-            fema_df, how="inner", on="COUNTY_FIPS")
-
-        # Convert WKT to geometry objects
-        counties_data['geometry'] = counties_data['geometry'].apply(wkt.loads)
-
-        # Get centroids of geometries for marker placement
-        counties_data['CENTROID_LON'] = counties_data['geometry'].apply(
-            lambda geom: geom.centroid.x)
-        counties_data['CENTROID_LAT'] = counties_data['geometry'].apply(
-            lambda geom: geom.centroid.y)
-
-        # Calculate variation between scenario and baseline
-        counties_data['VARIATION'] = counties_data[scenario] - \
-            counties_data['POPULATION_2065_S3']
-
-        # Percentage difference
-        counties_data['VARIATION_PCT'] = ((counties_data[scenario] - counties_data['POPULATION_2065_S3']) /
-                                        counties_data['POPULATION_2065_S3']) * 100
-
-        # Apply min-max scaling to normalize population values for marker size
-        min_pop = counties_data[scenario].min()
-        max_pop = counties_data[scenario].max()
-        counties_data['NORMALIZED_POP'] = (
-            counties_data[scenario] - min_pop) / (max_pop - min_pop)
-
-        # Create NRI risk buckets
-        counties_data['NRI_BUCKET'] = pd.cut(
-            counties_data['FEMA_NRI'],
-            bins=[0, 20, 40, 60, 80, 100],
-            labels=['Very Low', 'Low', 'Moderate', 'High', 'Very High'],
-            include_lowest=True
-        )
+@st.cache_data(ttl=3600, show_spinner=False)
+def _county_frame():
+    """County metadata merged with population projections, with parsed geometries and their centroids"""
+    # Shapely is only needed once the maps are built, so keep it off the page's import path
+    import shapely
 
-        # Convert to GeoDataFrame for spatial operations
-        counties_data = gpd.GeoDataFrame(counties_data)
+    counties_data = database.get_county_metadata()
+    counties_data = counties_data.merge(
+        database.get_population_projections_by_fips(),
+        how='inner',
+        on='COUNTY_FIPS'
+    )
 
-        # Extract the state FIPS from county FIPS (first 2 digits)
-        # Ensure it stays as a string
-        counties_data['STATE_FIPS'] = counties_data['COUNTY_FIPS'].str[:2]
+    # Projected populations fit float32 exactly (county populations stay below 2**24), halving the map payload
+    projection_columns = counties_data.filter(like='POPULATION_2065_').columns
+    counties_data[projection_columns] = counties_data[projection_columns].astype(np.float32)
 
-        # Check if CLIMATE_REGION exists in the dataframe
-        if 'CLIMATE_REGION' not in counties_data.columns:
-            st.error("Climate region data not available")
-            return None
+    # Convert WKT to geometry objects in one vectorized call
+    geometries = shapely.from_wkt(counties_data['geometry'].to_numpy())
+    counties_data['geometry'] = geometries
 
-        # For each state, determine the dominant climate region by most common value
-        state_climate_regions = counties_data.groupby('STATE_FIPS')['CLIMATE_REGION'].agg(
-            lambda x: x.value_counts().index[0] if len(x) > 0 else None
-        ).reset_index()
+    # Get centroids of geometries for marker placement
+    centroids = shapely.centroid(geometries)
+    counties_data['CENTROID_LON'] = shapely.get_x(centroids)
+    counties_data['CENTROID_LAT'] = shapely.get_y(centroids)
 
-        # Remove any rows where CLIMATE_REGION is None
-        state_climate_regions = state_climate_regions[state_climate_regions['CLIMATE_REGION'].notna(
-        )]
+    return counties_data
 
-        # Create a dictionary to map state FIPS to climate regions
-        # Ensure keys remain as strings
-        state_region_dict = dict(zip(state_climate_regions['STATE_FIPS'],
-                                     state_climate_regions['CLIMATE_REGION']))
 
-        # Create a list to store modified features
-        modified_features = []
+def _scenario_variation(counties_data, scenario):
+    """Population change from the baseline under a scenario, as (absolute, percentage) arrays"""
+    baseline = counties_data['POPULATION_2065_S3'].to_numpy(dtype=np.float64)
+    variation = counties_data[scenario].to_numpy(dtype=np.float64) - baseline
 
-        # Process each state feature
-        for feature in states_features['features']:
-            # Ensure the id is treated as a string
-            state_fips = feature['id']
+    # Reuse the difference for the percentage instead of subtracting the columns again
+    return variation, variation / baseline * 100
 
-            # Only include states that have climate region data
-            if state_fips in state_region_dict:
-                # Add climate region to the feature properties
-                if 'properties' not in feature:
-                    feature['properties'] = {}
 
-                feature['properties']['CLIMATE_REGION'] = state_region_dict[state_fips]
-                modified_features.append(feature)
+@st.cache_data(show_spinner=False)
+def _build_nri_fig(scenario):
+    """Build the FEMA NRI county choropleth for a scenario as a plain figure dict, or None without climate region data"""
+    import geopandas as gpd
+    from shapely.ops import unary_union
 
-        # Create a GeoDataFrame from the modified features
-        states_gdf = gpd.GeoDataFrame.from_features(modified_features)
+    # Load county GeoJSON data
+    counties = _load_counties_geojson()
 
-        # Ensure 'id' column is treated as string if it exists in the GeoDataFrame
-        if 'id' in states_gdf.columns:
-            states_gdf['id'] = states_gdf['id'].astype(str)
+    # Load states GeoJSON data
+    states_json = _load_states_geojson()
 
-        # Dissolve states by climate region
-        # This will create one geometry per unique climate region
-        climate_regions_gdf = states_gdf.dissolve(by='CLIMATE_REGION')
+    # Extract the features list directly
+    states_features = states_json
 
-        # Clean up geometries to remove internal boundaries
-        for idx, row in climate_regions_gdf.iterrows():
-            if row.geometry.geom_type == 'MultiPolygon':
-                cleaned_geom = unary_union(row.geometry)
-                climate_regions_gdf.at[idx, 'geometry'] = cleaned_geom
+    # Get county data merged with population projections, with geometries and centroids
+    counties_data = _county_frame()
 
-        # Convert to GeoJSON format for Plotly
-        climate_regions_geojson = json.loads(climate_regions_gdf.to_json())
+    # Get FEMA risk data
+    fema_df = database.get_stat_var(Table.COUNTY_FEMA_DATA, "FEMA_NRI",
+                            county_fips=counties_data['COUNTY_FIPS'].tolist(), year=2023)
 
-        # Get MSA counties for additional filtering if needed
-        msa_counties = database.get_cbsa_counties('metro')
+    # Merge FEMA data with counties data
+    counties_data = counties_data.merge(
+        fema_df, how="inner", on="COUNTY_FIPS")
 
-        msa_data = counties_data[counties_data['COUNTY_FIPS'].isin(
-            msa_counties['COUNTY_FIPS'])]
+    # Calculate variation between scenario and baseline, absolute and as a percentage
+    counties_data['VARIATION'], counties_data['VARIATION_PCT'] = _scenario_variation(
+        counties_data, scenario)
 
-        max_abs_variation = max(
-            abs(msa_data['VARIATION_PCT'].min()),
-            abs(msa_data['VARIATION_PCT'].max())
-        )
+    # Apply min-max scaling to normalize population values for marker size
+    min_pop = counties_data[scenario].min()
+    max_pop = counties_data[scenario].max()
+    counties_data['NORMALIZED_POP'] = (
+        counties_data[scenario] - min_pop) / (max_pop - min_pop)
 
-        # Create choropleth base layer with county boundaries
-        fig = px.choropleth(
-            counties_data,
-            geojson=counties,
-            color='NRI_BUCKET',
-            color_discrete_sequence=[
-                RISK_COLORS_RGBA[3],
-                RISK_COLORS_RGBA[4],
-                RISK_COLORS_RGBA[2],
-                RISK_COLORS_RGBA[1],
-                RISK_COLORS_RGBA[0],
-            ],
-            locations='COUNTY_FIPS',
-            scope="usa",
-            labels={
-                'COUNTY_NAME': 'County',
-                'CLIMATE_REGION': 'Climate Region',
-                'FEMA_NRI': 'National Risk Index',
-                scenario: 'Population'
-            },
-            basemap_visible=False,
-            hover_data={
-                'COUNTY_NAME': True,
-                'CLIMATE_REGION': True,
-                'FEMA_NRI': True,
-                'COUNTY_FIPS': False  # Hide FIPS code from hover
-            },
-            custom_data=['COUNTY_NAME', 'CLIMATE_REGION', 'FEMA_NRI']
-        )
+    # Create NRI risk buckets
+    counties_data['NRI_BUCKET'] = pd.cut(
+        counties_data['FEMA_NRI'],
+        bins=[0, 20, 40, 60, 80, 100],
+        labels=['Very Low', 'Low', 'Moderate', 'High', 'Very High'],
+        include_lowest=True
+    )
 
-        # Update hover template to format the display nicely
-        fig.update_traces(
-            hovertemplate='<b>%{customdata[0]}</b><br>' +
-                        'Climate Region: %{customdata[1]}<br>' +
-                        'National Risk Index: %{customdata[2]:.1f}<br>' +
-                        '<extra></extra>'  # Removes trace name from hover
-        )
+    # Convert to GeoDataFrame for spatial operations
+    counties_data = gpd.GeoDataFrame(counties_data)
 
-        # Add climate regions overlay with white borders
-        fig.add_trace(
-            go.Choropleth(
-                geojson=climate_regions_geojson,
-                # Convert index to list to ensure string format
-                locations=climate_regions_gdf.index.tolist(),
-                z=[1] * len(climate_regions_gdf),  # Dummy values for coloring
-                # Transparent fill
-                colorscale=[[0, 'rgba(0,0,0,0)'], [1, 'rgba(0,0,0,0)']],
-                marker_line_color='white',  # Border color for regions
-                marker_line_width=5,        # Thicker border for visibility
-                showscale=False,            # Hide the colorbar for this layer
-                name="Climate Regions",
-                showlegend=False,
-                hoverinfo='skip'
-            )
-        )
+    # Extract the state FIPS from county FIPS (first 2 digits)
+    # Ensure it stays as a string
+    counties_data['STATE_FIPS'] = counties_data['COUNTY_FIPS'].str[:2]
 
-        # Configure the map layout
-        fig.update_geos(
-            visible=False,
-            scope="usa",
-            showcoastlines=True,
-            projection_type="albers usa"
-        )
+    # Check if CLIMATE_REGION exists in the dataframe
+    if 'CLIMATE_REGION' not in counties_data.columns:
+        return None
 
-        fig.update_layout(
-            height=800,
-            title=dict(
-                text="County Population Gain w/ FEMA National Risk Index",
-                automargin=True,
-                y=0.95  # Adjust vertical position
-            ),
-            legend=dict(
-                title="",
-                itemsizing="constant",
-                groupclick="toggleitem",
-                tracegroupgap=20,  # Add space between legend groups
-                yanchor="top",
-                y=0.9,
-                xanchor="left",
-                x=1.01,
-                orientation="v"
-            ),
-            margin=dict(t=100, b=50, l=50, r=50),
-            autosize=True,
+    # For each state, determine the dominant climate region by most common value
+    state_climate_regions = counties_data.groupby('STATE_FIPS')['CLIMATE_REGION'].agg(
+        lambda x: x.value_counts().index[0] if len(x) > 0 else None
+    ).reset_index()
+
+    # Remove any rows where CLIMATE_REGION is None
+    state_climate_regions = state_climate_regions[state_climate_regions['CLIMATE_REGION'].notna(
+    )]
+
+    # Create a dictionary to map state FIPS to climate regions
+    # Ensure keys remain as strings
+    state_region_dict = dict(zip(state_climate_regions['STATE_FIPS'],
+                                 state_climate_regions['CLIMATE_REGION']))
+
+    # Create a list to store modified features
+    modified_features = []
+
+    # Process each state feature
+    for feature in states_features['features']:
+        # Ensure the id is treated as a string
+        state_fips = feature['id']
+
+        # Only include states that have climate region data
+        if state_fips in state_region_dict:
+            # Add climate region to the feature properties
+            if 'properties' not in feature:
+                feature['properties'] = {}
+
+            feature['properties']['CLIMATE_REGION'] = state_region_dict[state_fips]
+            modified_features.append(feature)
+
+    # Create a GeoDataFrame from the modified features
+    states_gdf = gpd.GeoDataFrame.from_features(modified_features)
+
+    # Ensure 'id' column is treated as string if it exists in the GeoDataFrame
+    if 'id' in states_gdf.columns:
+        states_gdf['id'] = states_gdf['id'].astype(str)
+
+    # Dissolve states by climate region
+    # This will create one geometry per unique climate region
+    climate_regions_gdf = states_gdf.dissolve(by='CLIMATE_REGION')
+
+    # Clean up geometries to remove internal boundaries
+    for row in climate_regions_gdf.itertuples():
+        if row.geometry.geom_type == 'MultiPolygon':
+            cleaned_geom = unary_union(row.geometry)
+            climate_regions_gdf.at[row.Index, 'geometry'] = cleaned_geom
+
+    # Convert to GeoJSON format for Plotly
+    climate_regions_geojson = json.loads(climate_regions_gdf.to_json())
+
+    # Get MSA counties for additional filtering if needed
+    msa_counties = database.get_cbsa_counties('metro')
+
+    msa_data = counties_data[counties_data['COUNTY_FIPS'].isin(
+        msa_counties['COUNTY_FIPS'])]
+
+    max_abs_variation = max(
+        abs(msa_data['VARIATION_PCT'].min()),
+        abs(msa_data['VARIATION_PCT'].max())
+    )
+
+    # Create choropleth base layer with county boundaries
+    fig = px.choropleth(
+        counties_data,
+        geojson=counties,
+        color='NRI_BUCKET',
+        color_discrete_sequence=[
+            RISK_COLORS_RGBA[3],
+            RISK_COLORS_RGBA[4],
+            RISK_COLORS_RGBA[2],
+            RISK_COLORS_RGBA[1],
+            RISK_COLORS_RGBA[0],
+        ],
+        locations='COUNTY_FIPS',
+        scope="usa",
+        labels={
+            'COUNTY_NAME': 'County',
+            'CLIMATE_REGION': 'Climate Region',
+            'FEMA_NRI': 'National Risk Index',
+            scenario: 'Population'
+        },
+        basemap_visible=False,
+        hover_data={
+            'COUNTY_NAME': True,
+            'CLIMATE_REGION': True,
+            'FEMA_NRI': True,
+            'COUNTY_FIPS': False  # Hide FIPS code from hover
+        },
+        custom_data=['COUNTY_NAME', 'CLIMATE_REGION', 'FEMA_NRI']
+    )
+
+    # Update hover template to format the display nicely
+    fig.update_traces(
+        hovertemplate='<b>%{customdata[0]}</b><br>' +
+                    'Climate Region: %{customdata[1]}<br>' +
+                    'National Risk Index: %{customdata[2]:.1f}<br>' +
+                    '<extra></extra>'  # Removes trace name from hover
+    )
+
+    # Add climate regions overlay with white borders
+    fig.add_trace(
+        go.Choropleth(
+            geojson=climate_regions_geojson,
+            # Convert index to list to ensure string format
+            locations=climate_regions_gdf.index.tolist(),
+            z=[1] * len(climate_regions_gdf),  # Dummy values for coloring
+            # Transparent fill
+            colorscale=[[0, 'rgba(0,0,0,0)'], [1, 'rgba(0,0,0,0)']],
+            marker_line_color='white',  # Border color for regions
+            marker_line_width=5,        # Thicker border for visibility
+            showscale=False,            # Hide the colorbar for this layer
+            name="Climate Regions",
+            showlegend=False,
+            hoverinfo='skip'
         )
+    )
+
+    # Configure the map layout
+    fig.update_geos(
+        visible=False,
+        scope="usa",
+        showcoastlines=True,
+        projection_type="albers usa"
+    )
+
+    fig.update_layout(
+        height=800,
+        title=dict(
+            text="County Population Gain w/ FEMA National Risk Index",
+            automargin=True,
+            y=0.95  # Adjust vertical position
+        ),
+        legend=dict(
+            title="",
+            itemsizing="constant",
+            groupclick="toggleitem",
+            tracegroupgap=20,  # Add space between legend groups
+            yanchor="top",
+            y=0.9,
+            xanchor="left",
+            x=1.01,
+            orientation="v"
+        ),
+        margin=dict(t=100, b=50, l=50, r=50),
+        autosize=True,
+    )
+
+    return fig.to_dict()
+
+
+def fema_nri_map(scenario):
+    try:
+        fig = _build_nri_fig(scenario)
+
+        if fig is None:
+            st.error("Climate region data not available")
+            return None
 
         event = st.plotly_chart(fig, on_select="ignore",
                                 selection_mode=["points"])
@@ -370,42 +410,25 @@ def population_by_climate_region(scenario):
     event : Streamlit event object
         The plotly chart event object
     """
+    import geopandas as gpd
+    from shapely.ops import unary_union
+
     try:
         # Load county GeoJSON data
-        with urlopen('https://raw.githubusercontent.com/plotly/datasets/master/geojson-counties-fips.json') as response:
-            counties = json.load(response)
+        counties = _load_counties_geojson()
 
         # Load states GeoJSON data
-        with urlopen('https://raw.githubusercontent.com/PublicaMundi/MappingAPI/master/data/geojson/us-states.json') as response:
-            states_json = json.load(response)
+        states_json = _load_states_geojson()
 
         # Extract the features list directly
         states_features = states_json
 
-        # Get county data and merge with population projections
-           
-        counties_data = database.get_county_metadata()
-        counties_data = counties_data.merge(
-            database.get_population_projections_by_fips(),
-            how='inner',
-            on='COUNTY_FIPS'
-        )
-
-        # Convert WKT to geometry objects
-        counties_data['geometry'] = counties_data['geometry'].apply(wkt.loads)
-
-        # Get centroids of geometries for marker placement
-        counties_data['CENTROID_LON'] = counties_data['geometry'].apply(
-            lambda geom: geom.centroid.x)
-        counties_data['CENTROID_LAT'] = counties_data['geometry'].apply(
-            lambda geom: geom.centroid.y)
-
-        # Calculate variation between scenario and baseline
-        counties_data['VARIATION'] = counties_data[scenario] - counties_data['POPULATION_2065_S3']
+        # Get county data merged with population projections, with geometries and centroids
+        counties_data = _county_frame()
 
-        # Percentage difference
-        counties_data['VARIATION_PCT'] = ((counties_data[scenario] - counties_data['POPULATION_2065_S3']) /
-                                        counties_data['POPULATION_2065_S3']) * 100
+        # Calculate variation between scenario and baseline, absolute and as a percentage
+        counties_data['VARIATION'], counties_data['VARIATION_PCT'] = _scenario_variation(
+            counties_data, scenario)
 
         # Convert to GeoDataFrame for spatial operations
         counties_data = gpd.GeoDataFrame(counties_data)
@@ -458,10 +481,10 @@ def population_by_climate_region(scenario):
         climate_regions_gdf = states_gdf.dissolve(by='CLIMATE_REGION')
 
         # Clean up geometries to remove internal boundaries
-        for idx, row in climate_regions_gdf.iterrows():
+        for row in climate_regions_gdf.itertuples():
             if row.geometry.geom_type == 'MultiPolygon':
                 cleaned_geom = unary_union(row.geometry)
-                climate_regions_gdf.at[idx, 'geometry'] = cleaned_geom
+                climate_regions_gdf.at[row.Index, 'geometry'] = cleaned_geom
 
         # Convert to GeoJSON format for Plotly
         climate_regions_geojson = json.loads(climate_regions_gdf.to_json())
@@ -570,14 +593,14 @@ def population_by_climate_region(scenario):
         )
 
         # Display annotations for climate regions
-        for region, row in climate_regions_gdf.iterrows():
+        for row in climate_regions_gdf.itertuples():
             # Get centroid of the region for label placement
             centroid = row.geometry.centroid
             
             fig.add_annotation(
                 x=centroid.x,
                 y=centroid.y,
-                text=region,
+                text=row.Index,
                 showarrow=False,
                 font=dict(
                     family="Arial",
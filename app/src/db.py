@@ -1,10 +1,17 @@
 import os
+import logging
+import threading
 import streamlit as st
 import pandas as pd
 from sqlalchemy import create_engine, text
+from sqlalchemy.sql.elements import TextClause
 from dotenv import load_dotenv
 from enum import Enum
-from typing import Optional, List, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, List, Union, Dict
+
+logger = logging.getLogger(__name__)
 
 
 class Table(Enum):
@@ -29,6 +36,34 @@ class Table(Enum):
     POPULATION_PROJECTIONS = "county_population_projections"
 
 
+@lru_cache(maxsize=None)
+def _sql(query: str) -> TextClause:
+    """
+    Return a text() construct for the query, building it only once per
+    distinct SQL string so repeated query shapes reuse the same statement
+    """
+    return text(query)
+
+
+def _fips_filter(county_fips: Union[str, List[str]]):
+    """
+    Build a COUNTY_FIPS WHERE clause and its bound parameters
+
+    Lists are bound as a single array parameter so the SQL text stays the
+    same no matter how many counties are requested, letting Postgres and
+    SQLAlchemy reuse the prepared statement across calls.
+    """
+    if isinstance(county_fips, list):
+        return " WHERE \"COUNTY_FIPS\" = ANY(:county_fips)", {'county_fips': [str(fips) for fips in county_fips]}
+
+    return " WHERE \"COUNTY_FIPS\" = :county_fips", {'county_fips': str(county_fips)}
+
+
+def _pad_fips(codes):
+    """Zero-pad FIPS codes (Series or Index) to five-character strings, keeping missing values missing"""
+    return codes.astype("string").str.zfill(5).astype(object)
+
+
 class Database:
     _instance = None
 
@@ -58,7 +93,11 @@ class Database:
         # Set SSL mode based on environment
         self.ssl_mode = "require" if ENVIRONMENT == "prod" else "disable"
         self.environment = ENVIRONMENT
+        self.engine = None
         self.conn = None
+        self._fips_dtype = None
+        self._fips_lock = threading.Lock()
+        self._table_columns = {}
         self._initialized = True
 
     def connect(self):
@@ -70,15 +109,15 @@ class Database:
             engine = create_engine(
                 self.database_url.replace("postgres://", "postgresql://", 1),
                 connect_args={"sslmode": self.ssl_mode},
+                # Room for every query shape the dashboard issues
+                query_cache_size=500,
             )
 
+            self.engine = engine
             self.conn = engine.connect()
 
-            print(
-                f"Dashboard running from \033[1m{self.environment}\033[0m environment")
-            print(
-                f"Database connection established via URL: \033[1m{self.conn.engine.url}\033[0m")
-            print()
+            logger.info("Dashboard running from %s environment", self.environment)
+            logger.info("Database connection established via URL: %s", engine.url)
 
             return self.conn
         except Exception as e:
@@ -90,6 +129,116 @@ class Database:
             self.conn.close()
             self.conn = None
 
+    def fips_dtype(self) -> pd.CategoricalDtype:
+        """
+        Categorical dtype over every county FIPS code in the startup tables
+
+        Built exactly once, by prefetch_startup, from the union of the codes
+        in every prefetched table, and never changed afterwards, so every
+        frame cast to it shares the same categories.
+        """
+        if self._fips_dtype is None:
+            # The dtype is fixed while the startup tables load
+            self.prefetch_startup()
+
+        return self._fips_dtype
+
+    def _build_fips_dtype(self, frames) -> None:
+        """Fix the shared FIPS dtype from the codes in frames, unless it already exists"""
+        with self._fips_lock:
+            if self._fips_dtype is not None:
+                return
+
+            codes = pd.Index(pd.concat(
+                [_pad_fips(df["COUNTY_FIPS"]) for df in frames if "COUNTY_FIPS" in df.columns],
+                ignore_index=True).dropna().unique()).sort_values()
+            self._fips_dtype = pd.CategoricalDtype(categories=codes, ordered=False)
+
+    def _as_fips_categorical(self, codes):
+        """
+        Cast a Series or Index of FIPS codes to the shared FIPS dtype
+
+        Codes are zero-padded to five digits first. If any code is outside
+        the shared categories, the codes are logged and returned as plain
+        padded strings rather than cast, so no valid row becomes NaN.
+        """
+        codes = _pad_fips(codes)
+        dtype = self.fips_dtype()
+
+        unknown = pd.Index(codes.dropna().unique()).difference(dtype.categories)
+        if len(unknown):
+            logger.warning(
+                "%d COUNTY_FIPS codes are not in the startup tables, keeping them as strings: %s",
+                len(unknown), ", ".join(unknown[:20]))
+            return codes
+
+        return codes.astype(dtype)
+
+    def table_columns(self, table: Table) -> frozenset:
+        """
+        Column names of a table, read from information_schema once per table
+
+        Used to whitelist identifiers before they are formatted into SQL.
+        """
+        table = Table(table)
+
+        if table not in self._table_columns:
+            query = _sql(
+                "SELECT column_name FROM information_schema.columns WHERE table_name = :table_name")
+            columns = pd.read_sql(query, self.conn, params={'table_name': table.value})
+            self._table_columns[table] = frozenset(columns["column_name"])
+
+        return self._table_columns[table]
+
+    def _categorize_fips(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert the COUNTY_FIPS column (if present) to the shared FIPS dtype"""
+        if "COUNTY_FIPS" in df.columns:
+            df["COUNTY_FIPS"] = self._as_fips_categorical(df["COUNTY_FIPS"])
+
+        return df
+
+    @st.cache_resource
+    def prefetch_startup(_self) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch the full tables every dashboard render starts from
+
+        The queries run concurrently, each on its own pooled connection, so the
+        cold start pays roughly one round trip instead of one per table.
+
+        Returns:
+        --------
+        bundle : dict
+            DataFrames keyed by 'counties', 'population_historical' and
+            'population_projections'
+        """
+        queries = {
+            'counties': f"SELECT * FROM {Table.COUNTY_METADATA.value}",
+            'population_historical': f"SELECT * FROM {Table.POPULATION_HISTORY.value}",
+            'population_projections': f"SELECT * FROM {Table.POPULATION_PROJECTIONS.value}",
+        }
+
+        def fetch(query):
+            with _self.engine.connect() as conn:
+                return pd.read_sql(_sql(query), conn)
+
+        try:
+            # Open the engine up front so worker threads only take pooled connections
+            _self.connect()
+
+            with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+                futures = {name: executor.submit(fetch, query)
+                           for name, query in queries.items()}
+
+                bundle = {name: future.result() for name, future in futures.items()}
+
+            # Fix the shared FIPS dtype from every table's codes before casting any of them
+            _self._build_fips_dtype(bundle.values())
+
+            return {name: _self._categorize_fips(df) for name, df in bundle.items()}
+        except Exception as e:
+            st.error(f"Error loading dashboard data: {str(e)}")
+            st.stop()
+
     @st.cache_data
     def get_population_projections_by_fips(_self, county_fips: Optional[Union[str, List[str]]] = None) -> pd.DataFrame:
         """
@@ -108,17 +257,16 @@ class Database:
         conn = _self.conn
         try:
             query = "SELECT * FROM county_population_projections"
+            params = {}
 
             # Add COUNTY_FIPS filter if provided
             if county_fips is not None:
-                if isinstance(county_fips, list):
-                    fips_list = ", ".join(str(fips) for fips in county_fips)
-                    query += f" WHERE COUNTY_FIPS IN ({fips_list})"
-                else:
-                    query += f" WHERE COUNTY_FIPS = {county_fips}"
+                where, params = _fips_filter(county_fips)
+                query += where
 
             # Execute query and return as DataFrame
-            df = pd.read_sql(query, conn)
+            df = pd.read_sql(_sql(query), conn, params=params)
+            df = _self._categorize_fips(df)
 
             return df
         except Exception as e:
@@ -143,17 +291,16 @@ class Database:
         conn = _self.conn
         try:
             query = "SELECT * FROM timeseries_population"
+            params = {}
 
             # Add COUNTY_FIPS filter if provided
             if county_fips is not None:
-                if isinstance(county_fips, list):
-                    fips_list = ", ".join(str(fips) for fips in county_fips)
-                    query += f" WHERE COUNTY_FIPS IN ({fips_list})"
-                else:
-                    query += f" WHERE COUNTY_FIPS = {county_fips}"
+                where, params = _fips_filter(county_fips)
+                query += where
 
             # Execute query and return as DataFrame
-            df = pd.read_sql(query, conn)
+            df = pd.read_sql(_sql(query), conn, params=params)
+            df = _self._categorize_fips(df)
 
             return df
         except Exception as e:
@@ -178,24 +325,25 @@ class Database:
         conn = _self.conn
         try:
             query = "SELECT * FROM timeseries_median_gross_rent"
+            params = {}
 
             # Add COUNTY_FIPS filter if provided
             if county_fips is not None:
-                if isinstance(county_fips, list):
-                    fips_list = ", ".join(str(fips) for fips in county_fips)
-                    query += f" WHERE \"COUNTY_FIPS\" IN ({fips_list})"
-                else:
-                    query += f" WHERE \"COUNTY_FIPS\" = {county_fips}"
+                where, params = _fips_filter(county_fips)
+                query += where
 
-            # Execute query and return as DataFrame
-            df = pd.read_sql(query, conn).set_index("COUNTY_FIPS")
+            # Let read_sql build the FIPS index directly so the frame isn't
+            # copied by a separate set_index before it is transposed
+            df = pd.read_sql(_sql(query), conn, params=params,
+                             index_col="COUNTY_FIPS")
+            df.index = _self._as_fips_categorical(df.index)
 
             return df.T
         except Exception as e:
             st.error(f"Error loading historical median gross rent: {str(e)}")
             st.stop()
 
-    @st.cache_data
+    @st.cache_data(ttl=3600, show_spinner=False)
     def get_stat_var(_self, table: Table, indicator_name: str, county_fips: str, year: Optional[int] = None) -> pd.DataFrame:
         """
         Get county data from a statistical variable's specified table
@@ -217,29 +365,27 @@ class Database:
             DataFrame containing population projection data
         """
         conn = _self.conn
-        table_name = table.value
 
         try:
+            # Only known tables and columns may be formatted into the query text
+            table_name = Table(table).value
+            if indicator_name not in _self.table_columns(table):
+                raise ValueError(
+                    f"Unknown indicator '{indicator_name}' for table '{table_name}'")
+
             # Initialize parameters dictionary
             params = {}
 
             # Add COUNTY_FIPS filter if provided
             if county_fips is not None:
                 if isinstance(county_fips, list):
-                    # Create base query
+                    # Multiple counties need the FIPS column to tell rows apart
                     query = f'SELECT "YEAR", "{indicator_name}", "COUNTY_FIPS" FROM "{table_name}"'
-
-                    # For multiple counties
-                    query += " WHERE \"COUNTY_FIPS\" IN :county_fips"
-                    params['county_fips'] = tuple(
-                        str(fips) for fips in county_fips)
                 else:
-                    # Create base query
                     query = f'SELECT "YEAR", "{indicator_name}" FROM "{table_name}"'
 
-                    # For single county
-                    query += " WHERE \"COUNTY_FIPS\" = :county_fips"
-                    params['county_fips'] = str(county_fips)
+                where, params = _fips_filter(county_fips)
+                query += where
 
                 if year:
                     query += f' AND "YEAR" = :year'
@@ -249,19 +395,73 @@ class Database:
             query += f" ORDER BY \"{table_name}\".\"YEAR\" ASC"
 
             # Convert to SQLAlchemy text object
-            sql_query = text(query)
+            sql_query = _sql(query)
 
             # Execute query and return as DataFrame
             df = pd.read_sql(sql_query, conn, params=params)
 
             df.YEAR = pd.to_datetime(df.YEAR, format='%Y').dt.year
-            df = df.set_index("YEAR")
+            df = _self._categorize_fips(df).set_index("YEAR")
 
             return df
         except Exception as e:
             st.error(f"Error loading time series data: {str(e)}")
             st.stop()
 
+    @st.cache_data(ttl=3600, show_spinner=False)
+    def get_stat_vars(_self, table: Table, indicator_names: List[str], county_fips: str, year: Optional[int] = None) -> pd.DataFrame:
+        """
+        Get several statistical variables for one county from a table in a single query
+
+        Parameters:
+        -----------
+        table : SQL table to be queried
+            Enum for the table to query in the database.
+        indicator_names : list
+            Names of the indicators to pull from the table.
+        county_fips : str
+            County FIPS code to query.
+        year : int, optional
+            Specific year to query. If None, returns all years.
+
+        Returns:
+        --------
+        df : pandas.DataFrame
+            DataFrame indexed by YEAR with one column per indicator
+        """
+        conn = _self.conn
+
+        # Only known tables and columns may be formatted into the query text. A bad name is a
+        # caller bug, so it is raised as-is rather than reported as a data loading failure
+        table_name = Table(table).value
+        unknown = set(indicator_names) - _self.table_columns(table)
+        if unknown:
+            raise ValueError(
+                f"Unknown indicators {sorted(unknown)} for table '{table_name}'")
+
+        try:
+            columns = ", ".join(f'"{name}"' for name in indicator_names)
+            query = f'SELECT "YEAR", {columns} FROM "{table_name}"'
+
+            where, params = _fips_filter(county_fips)
+            query += where
+
+            if year:
+                query += ' AND "YEAR" = :year'
+                params['year'] = year
+
+            # Sort the results of the query
+            query += f" ORDER BY \"{table_name}\".\"YEAR\" ASC"
+
+            df = pd.read_sql(_sql(query), conn, params=params)
+
+            df.YEAR = pd.to_datetime(df.YEAR, format='%Y').dt.year
+
+            return df.set_index("YEAR")
+        except Exception as e:
+            st.error(f"Error loading time series data: {str(e)}")
+            st.stop()
+
     @st.cache_data
     def get_county_metadata(_self, county_fips: Optional[Union[str, List[str]]] = None) -> pd.DataFrame:
         """
@@ -284,26 +484,17 @@ class Database:
 
             # Add COUNTY_FIPS filter if provided
             if county_fips is not None:
-                if isinstance(county_fips, list):
-                    # Create proper parameter placeholders for IN clause
-                    placeholders = ", ".join(
-                        f":fips_{i}" for i in range(len(county_fips)))
-                    query += f" WHERE \"COUNTY_FIPS\" IN ({placeholders})"
-
-                    # Create a dictionary of parameters
-                    params = {f"fips_{i}": fips for i,
-                              fips in enumerate(county_fips)}
-                else:
-                    query += " WHERE \"COUNTY_FIPS\" = :county_fips"
-                    params = {'county_fips': county_fips}
+                where, params = _fips_filter(county_fips)
+                query += where
             else:
                 params = {}
 
             # Convert to SQLAlchemy text object
-            sql_query = text(query)
+            sql_query = _sql(query)
 
             # Execute query and return as DataFrame
             df = pd.read_sql(sql_query, conn, params=params)
+            df = _self._categorize_fips(df)
 
             return df
         except Exception as e:
@@ -338,7 +529,8 @@ class Database:
                     query += f" WHERE \"TYPE\" = 'Micropolitan Statistical Area'"
 
             # Execute query and return as DataFrame
-            df = pd.read_sql(query, conn)
+            df = pd.read_sql(_sql(query), conn)
+            df = _self._categorize_fips(df)
 
             return df
         except Exception as e:
@@ -362,13 +554,14 @@ class Database:
         """
         conn = _self.conn
         try:
-            query = text("SELECT * FROM projected_socioeconomic_indices WHERE \"COUNTY_FIPS\" = :county_fips")
+            query = _sql("SELECT * FROM projected_socioeconomic_indices WHERE \"COUNTY_FIPS\" = :county_fips")
             
             # Execute query with parameter
             df = pd.read_sql(query, conn, params={'county_fips': county_fips})
             
             # Reset index and drop the old index
             df = df.reset_index(drop=True)
+            df = _self._categorize_fips(df)
             
             return df
         except Exception as e:
@@ -392,13 +585,14 @@ class Database:
         """
         conn = _self.conn
         try:
-            query = text(f"SELECT * FROM {table.value} WHERE \"COUNTY_FIPS\" = :county_fips")
+            query = _sql(f"SELECT * FROM {Table(table).value} WHERE \"COUNTY_FIPS\" = :county_fips")
             
             # Execute query with parameter
             df = pd.read_sql(query, conn, params={'county_fips': county_fips})
             
             # Reset index and drop the old index
             df = df.reset_index(drop=True)
+            df = _self._categorize_fips(df)
             
             return df
         except Exception as e:
@@ -411,8 +605,11 @@ db = Database()
 # For backwards compatibility
 
 
+@st.cache_resource
 def get_db_connection():
     """
     For backwards compatibility - returns the database connection
+
+    Cached as a Streamlit resource so reruns and sessions share one connection
     """
     return db.connect()
@@ -1,10 +1,15 @@
 import streamlit as st
+from dataclasses import dataclass
+from functools import lru_cache
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 
 from src.db import db as database, Table, get_db_connection
+from src.utils import lttb_downsample, pct_of_total
 
 from src.components import (
     vertical_spacer,
@@ -18,7 +23,121 @@ from src.components import (
     plot_socioeconomic_radar,
 )
 
-def display_scenario_impact_analysis(county_name, state_name, projected_data):
+# Serialize figures for st.plotly_chart with orjson
+pio.json.config.default_engine = "orjson"
+
+# Plotly.js options shared by every chart; built once rather than per st.plotly_chart call
+PLOTLY_CONFIG = {"responsive": True}
+
+# Plotly's default look plus the grid, legend and margins shared by the indicator charts
+pio.templates["dashboard"] = pio.templates.merge_templates(
+    "plotly",
+    go.layout.Template(layout=dict(
+        xaxis=dict(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.1)'),
+        yaxis=dict(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.1)'),
+        # Horizontal legend centered below the plot
+        legend=dict(orientation="h", yanchor="bottom", y=-0.3, xanchor="center", x=0.5),
+        # Increased bottom margin to accommodate legend
+        margin=dict(l=40, r=40, t=40, b=100),
+        autosize=True,
+    )),
+)
+
+# Shared layout for dual-axis charts; traces opt into the right axis with yaxis='y2'
+SECONDARY_Y_LAYOUT = go.Layout(
+    yaxis2=dict(anchor='x', overlaying='y', side='right', showgrid=False),
+)
+
+# Projection scenarios in display order; "Original" holds the unprojected baseline rows
+SCENARIO_DTYPE = pd.CategoricalDtype(
+    ['Original', 'S3', 'S5a', 'S5b', 'S5c'], ordered=True)
+
+# 2065 population projection columns charted per county, with their legend labels
+# TODO: Rewrite to work with any number of scenarios that are included in the projections
+SCENARIOS = (
+    'POPULATION_2065_S3',
+    'POPULATION_2065_S5a',
+    'POPULATION_2065_S5b',
+    'POPULATION_2065_S5c',
+)
+SCENARIO_LABELS = (
+    'Scenario S3',
+    'Scenario S5a',
+    'Scenario S5b',
+    'Scenario S5c',
+)
+
+# Climate impact level shown for each selectable 2065 projection column
+SCENARIO_IMPACT_LEVELS = {
+    # "POPULATION_2065_S3": "Baseline",
+    "POPULATION_2065_S5a": "Low",
+    "POPULATION_2065_S5b": "Medium",
+    "POPULATION_2065_S5c": "High",
+}
+SCENARIO_OPTIONS = tuple(SCENARIO_IMPACT_LEVELS)
+
+# Housing table columns with their chart panel titles
+HOUSING_INDICATORS = [
+    ("MEDIAN_GROSS_RENT", "Median Gross Rent"),
+    ("MEDIAN_HOUSING_VALUE", "Median House Value"),
+    ("TOTAL_HOUSING_UNITS", "Total Housing Units"),
+    ("OCCUPIED_HOUSING_UNITS", "Occupied Housing Units"),
+]
+
+# Educational attainment columns with their chart legend names and marker symbols
+EDUCATION_ATTAINMENT_TRACES = [
+    ("LESS_THAN_HIGH_SCHOOL_TOTAL", "Less than High School (%)", "circle"),
+    ("HIGH_SCHOOL_GRADUATE_TOTAL", "High School Graduate (%)", "square"),
+    ("SOME_COLLEGE_TOTAL", "Some College or Associate's Degree (%)", "triangle-up"),
+    ("BACHELORS_OR_HIGHER_TOTAL", "Bachelor's Degree or Higher (%)", "diamond"),
+]
+
+# Education levels as (chart column prefix, database indicator prefix) pairs
+EDUCATION_LEVELS = [
+    ("LessThanHighSchool", "LESS_THAN_HIGH_SCHOOL"),
+    ("HighSchoolGraduate", "HIGH_SCHOOL_GRADUATE"),
+    ("SomeCollege", "SOME_COLLEGE"),
+    ("BachelorsOrHigher", "BACHELORS_OR_HIGHER"),
+]
+
+# Unemployment-by-education chart traces as (column prefix, legend name, marker symbol)
+EDUCATION_UNEMPLOYMENT_TRACES = [
+    ("LessThanHighSchool", "Less Than High School", "circle"),
+    ("HighSchoolGraduate", "High School Graduate", "square"),
+    ("SomeCollege", "Some College or Associate's Degree", "triangle-up"),
+    ("BachelorsOrHigher", "Bachelor's Degree or Higher", "diamond"),
+]
+
+def _scenario_categorical(scenarios):
+    """Cast SCENARIO values to SCENARIO_DTYPE, sorting any scenario it doesn't list after the known ones instead of dropping it to NaN."""
+    unknown = pd.Index(scenarios.dropna().unique()).difference(SCENARIO_DTYPE.categories)
+    if not len(unknown):
+        return scenarios.astype(SCENARIO_DTYPE)
+
+    return scenarios.astype(pd.CategoricalDtype(
+        SCENARIO_DTYPE.categories.append(unknown), ordered=True))
+
+
+@dataclass(slots=True)
+class ScenarioArrays:
+    """Per-scenario chart inputs as plain NumPy arrays, ordered by scenario."""
+    scenarios: np.ndarray
+    emp_pct: np.ndarray
+    stratio: np.ndarray
+    avail: np.ndarray
+
+    @classmethod
+    def from_frame(cls, projected_data):
+        df = projected_data.sort_values('SCENARIO')
+        return cls(
+            scenarios=df['SCENARIO'].astype(str).to_numpy(),
+            emp_pct=df['TOTAL_EMPLOYED_PERCENTAGE'].to_numpy(),
+            stratio=df['STUDENT_TEACHER_RATIO'].to_numpy(),
+            avail=df['AVAILABLE_HOUSING_UNITS'].to_numpy(),
+        )
+
+
+def display_scenario_impact_analysis(county_name, state_name, projected_data, scenario_arrays):
     """
     Display comprehensive impact analysis based on projected data
     """
@@ -61,11 +180,12 @@ def display_scenario_impact_analysis(county_name, state_name, projected_data):
         """)
         
         # Display employment chart
-        employment_chart = create_employment_chart(projected_data)
-        st.plotly_chart(employment_chart, use_container_width=True)
+        employment_chart = create_employment_chart(scenario_arrays)
+        st.plotly_chart(employment_chart, use_container_width=True, config=PLOTLY_CONFIG)
         
         # Add interpretation based on the data
-        unemployment_above_threshold = any(100 - row['TOTAL_EMPLOYED_PERCENTAGE'] > 4.0 for _, row in projected_data.iterrows())
+        unemployment_rate = 100 - projected_data['TOTAL_EMPLOYED_PERCENTAGE']
+        unemployment_above_threshold = (unemployment_rate > 4.0).any()
         
         if unemployment_above_threshold:
             st.warning(":material/warning: Under some scenarios, unemployment may rise above the 4% NAIRU threshold, which could indicate economic stress.")
@@ -81,11 +201,12 @@ def display_scenario_impact_analysis(county_name, state_name, projected_data):
         """)
         
         # Display education chart
-        education_chart = create_student_teacher_chart(projected_data)
-        st.plotly_chart(education_chart, use_container_width=True)
+        education_chart = create_student_teacher_chart(scenario_arrays)
+        st.plotly_chart(education_chart, use_container_width=True, config=PLOTLY_CONFIG)
         
         # Add interpretation based on the data
-        high_ratio_scenarios = [row['SCENARIO'] for _, row in projected_data.iterrows() if row['STUDENT_TEACHER_RATIO'] > 16.0]
+        high_ratio = projected_data['STUDENT_TEACHER_RATIO'] > 16.0
+        high_ratio_scenarios = projected_data.loc[high_ratio, 'SCENARIO'].tolist()
         
         if high_ratio_scenarios:
             st.warning(f"⚠️ The student-teacher ratio exceeds the recommended level in {', '.join(high_ratio_scenarios)}. This may require additional educational resources or staff.")
@@ -101,70 +222,77 @@ def display_scenario_impact_analysis(county_name, state_name, projected_data):
         """)
         
         # Display housing chart
-        housing_chart = create_housing_chart(projected_data)
-        st.plotly_chart(housing_chart, use_container_width=True)
+        housing_chart = create_housing_chart(scenario_arrays)
+        st.plotly_chart(housing_chart, use_container_width=True, config=PLOTLY_CONFIG)
         
         # Calculate and add interpretation
-        for _, row in projected_data.iterrows():
-            occupancy_rate = (row['OCCUPIED_HOUSING_UNITS'] / (row['OCCUPIED_HOUSING_UNITS'] + row['AVAILABLE_HOUSING_UNITS'])) * 100
-            vacancy_rate = 100 - occupancy_rate
-            
-            if vacancy_rate < 5:
-                st.warning(f"In the {row['SCENARIO']} scenario, the vacancy rate is below 5%, indicating a potential housing shortage.")
-            elif vacancy_rate > 8:
-                st.info(f"In the {row['SCENARIO']} scenario, the vacancy rate is above 8%, suggesting potential excess housing capacity.")
+        vacancy_rates = projected_data['VACANCY_RATE']
+
+        low_vacancy = projected_data.loc[vacancy_rates < 5, 'SCENARIO']
+        high_vacancy = projected_data.loc[vacancy_rates > 8, 'SCENARIO']
+
+        # Group the messages so each kind is a single Streamlit element
+        if not low_vacancy.empty:
+            st.warning("\n\n".join(
+                f"In the {scenario} scenario, the vacancy rate is below 5%, indicating a potential housing shortage."
+                for scenario in low_vacancy))
+        if not high_vacancy.empty:
+            st.info("\n\n".join(
+                f"In the {scenario} scenario, the vacancy rate is above 8%, suggesting potential excess housing capacity."
+                for scenario in high_vacancy))
 
 def generate_policy_recommendations(projected_data):
     """Generate policy recommendations based on the projected data"""
     st.write("# Policy Recommendations")
     
-    # Calculate metrics for recommendations
+    # Calculate metrics once for the scenarios that recommendations are made for
+    selected = projected_data[projected_data['SCENARIO'].isin(['S5b', 'S5c'])]
+
+    unemployment_rates = 100 - selected['TOTAL_EMPLOYED_PERCENTAGE']
+    vacancy_rates = selected['VACANCY_RATE']
+
     recommendations = []
     
     # Check employment metrics
-    for _, row in projected_data.iterrows():
-        unemployment_rate = 100 - row['TOTAL_EMPLOYED_PERCENTAGE']
-        if unemployment_rate > 4.0 and row['SCENARIO'] in ['S5b', 'S5c']:
-            recommendations.append({
-                'category': 'Employment',
-                'scenario': row['SCENARIO'],
-                'issue': f"Projected unemployment rate of {unemployment_rate:.1f}% exceeds optimal levels",
-                'recommendation': "Consider workforce development programs and economic incentives to attract industries likely to thrive in changing climate conditions."
-            })
+    high_unemployment = unemployment_rates > 4.0
+    for scenario, unemployment_rate in zip(selected.loc[high_unemployment, 'SCENARIO'], unemployment_rates[high_unemployment]):
+        recommendations.append({
+            'category': 'Employment',
+            'scenario': scenario,
+            'issue': f"Projected unemployment rate of {unemployment_rate:.1f}% exceeds optimal levels",
+            'recommendation': "Consider workforce development programs and economic incentives to attract industries likely to thrive in changing climate conditions."
+        })
     
     # Check education metrics
-    for _, row in projected_data.iterrows():
-        if row['STUDENT_TEACHER_RATIO'] > 16.0 and row['SCENARIO'] in ['S5b', 'S5c']:
-            recommendations.append({
-                'category': 'Education',
-                'scenario': row['SCENARIO'],
-                'issue': f"Student-teacher ratio of {row['STUDENT_TEACHER_RATIO']:.1f} exceeds national average",
-                'recommendation': "Plan for educational infrastructure expansion and teacher recruitment to maintain educational quality with population growth."
-            })
+    high_ratio = selected[selected['STUDENT_TEACHER_RATIO'] > 16.0]
+    for scenario, ratio in zip(high_ratio['SCENARIO'], high_ratio['STUDENT_TEACHER_RATIO']):
+        recommendations.append({
+            'category': 'Education',
+            'scenario': scenario,
+            'issue': f"Student-teacher ratio of {ratio:.1f} exceeds national average",
+            'recommendation': "Plan for educational infrastructure expansion and teacher recruitment to maintain educational quality with population growth."
+        })
     
     # Check housing metrics
-    for _, row in projected_data.iterrows():
-        occupancy_rate = (row['OCCUPIED_HOUSING_UNITS'] / (row['OCCUPIED_HOUSING_UNITS'] + row['AVAILABLE_HOUSING_UNITS'])) * 100
-        vacancy_rate = 100 - occupancy_rate
-        
-        if vacancy_rate <= 0 and row['SCENARIO'] in ['S5b', 'S5c']:
+    for scenario, vacancy_rate in zip(selected['SCENARIO'], vacancy_rates):
+        if vacancy_rate <= 0:
             recommendations.append({
                 'category': 'Housing',
-                'scenario': row['SCENARIO'],
+                'scenario': scenario,
                 'issue': f"Negative vacancy rate of {vacancy_rate:.1f}% indicates a shortage of housing.",
                 'recommendation': "Implement zoning reforms and incentives for affordable housing development to accommodate projected population growth."
             })
-        elif vacancy_rate < 5 and row['SCENARIO'] in ['S5b', 'S5c']:
+        elif vacancy_rate < 5:
             recommendations.append({
                 'category': 'Housing',
-                'scenario': row['SCENARIO'],
+                'scenario': scenario,
                 'issue': f"Low vacancy rate of {vacancy_rate:.1f}% indicates potential housing shortage",
                 'recommendation': "Implement zoning reforms and incentives for affordable housing development to accommodate projected population growth."
             })
-        elif vacancy_rate > 8 and row['SCENARIO'] in ['S5b', 'S5c']:
+        elif vacancy_rate > 8:
             recommendations.append({
                 'category': 'Housing',
-                'scenario': row['SCENARIO'],
+                'scenario': scenario,
                 'issue': f"High vacancy rate of {vacancy_rate:.1f}% indicates potential housing surplus",
                 'recommendation': "Consider adaptive reuse strategies for vacant properties and focus on maintaining existing housing stock quality."
             })
@@ -181,35 +309,30 @@ def generate_policy_recommendations(projected_data):
     else:
         st.info("Based on current projections, no critical interventions are needed as metrics remain within healthy ranges across scenarios.")
 
-def create_housing_chart(projected_data):
-    # Make a copy of the dataframe to avoid modifying the original
-    df = projected_data.copy()
-    
-    # Sort the dataframe by SCENARIO
-    df = df.sort_values('SCENARIO')
-    
-        # Get the max absolute value for symmetric axis
-    max_value = max(abs(df['AVAILABLE_HOUSING_UNITS'].max()), 
-                    abs(df['AVAILABLE_HOUSING_UNITS'].min()))
-
-    # Calculate housing metrics if not already in the dataframe
-    if 'HOUSING_OCCUPANCY_RATE' not in df.columns:
-        df['HOUSING_OCCUPANCY_RATE'] = (df['OCCUPIED_HOUSING_UNITS'] / (df['OCCUPIED_HOUSING_UNITS'] + df['AVAILABLE_HOUSING_UNITS'])) * 100
+# The create_*_chart builders below return plain figure dicts rather than go.Figure objects, so
+# each cache hit only has to unpickle a dict
+@st.cache_data(show_spinner=False)
+def create_housing_chart(scenario_arrays):
+    # Get the max absolute value for symmetric axis
+    max_value = np.abs(scenario_arrays.avail).max()
     
     # Create the horizontal bar chart
-    fig = go.Figure()
+    fig = go.Figure(_validate=False)
     
-    # Sort the data by AVAILABLE_HOUSING_UNITS for better visualization
-    sorted_data = df.sort_values('AVAILABLE_HOUSING_UNITS')
+    # Sort the data by available housing units for better visualization
+    order = np.argsort(scenario_arrays.avail, kind='stable')
+    scenarios = scenario_arrays.scenarios[order]
+    available = scenario_arrays.avail[order]
 
     fig.add_trace(go.Bar(
-        y=sorted_data['SCENARIO'],
-        x=sorted_data['AVAILABLE_HOUSING_UNITS'],
+        y=scenarios,
+        x=available,
         orientation='h',
         marker=dict(
-            color=sorted_data['AVAILABLE_HOUSING_UNITS'].apply(lambda x: '#E07069' if x < 0 else '#509BC7'),
+            color=np.where(available < 0, '#E07069', '#509BC7').tolist(),
             line=dict(color='rgba(0, 0, 0, 0.2)', width=1)
-        )
+        ),
+        _validate=False
     ))
 
     # Update layout for better appearance
@@ -235,22 +358,19 @@ def create_housing_chart(projected_data):
     fig.add_shape(
         type="line",
         x0=0, y0=-0.5,
-        x1=0, y1=len(sorted_data) - 0.5,
+        x1=0, y1=len(scenarios) - 0.5,
         line=dict(color="black", width=1, dash="solid")
     )
 
-    # Display the chart
-    return fig
+    return fig.to_dict()
 
-def create_student_teacher_chart(projected_data):
-    # Make a copy of the dataframe to avoid modifying the original
-    df = projected_data.copy()
-    
-    # Sort the dataframe by SCENARIO
-    df = df.sort_values('SCENARIO')
+@st.cache_data(show_spinner=False)
+def create_student_teacher_chart(scenario_arrays):
+    scenarios = scenario_arrays.scenarios
+    ratios = scenario_arrays.stratio
     
     # Create figure
-    fig = go.Figure()
+    fig = go.Figure(_validate=False)
     
     # Define the optimal student-teacher ratio threshold
     optimal_ratio = 16.0  # National average is around 16:1
@@ -258,17 +378,15 @@ def create_student_teacher_chart(projected_data):
     # Add bar for each scenario
     fig.add_trace(
         go.Bar(
-            x=df['SCENARIO'],
-            y=df['STUDENT_TEACHER_RATIO'],
+            x=scenarios,
+            y=ratios,
             marker=dict(
-                color=[
-                    '#E07069' if ratio > optimal_ratio else '#509BC7' 
-                    for ratio in df['STUDENT_TEACHER_RATIO']
-                ]
+                color=np.where(ratios > optimal_ratio, '#E07069', '#509BC7').tolist()
             ),
-            text=[f"{ratio:.1f}" for ratio in df['STUDENT_TEACHER_RATIO']],
+            text=[f"{ratio:.1f}" for ratio in ratios],
             textposition='auto',
-            hovertemplate='Student-Teacher Ratio: %{y:.1f}<extra></extra>'
+            hovertemplate='Student-Teacher Ratio: %{y:.1f}<extra></extra>',
+            _validate=False
         )
     )
     
@@ -277,7 +395,7 @@ def create_student_teacher_chart(projected_data):
         type="line",
         x0=-0.5,
         y0=optimal_ratio,
-        x1=len(df) - 0.5,
+        x1=len(scenarios) - 0.5,
         y1=optimal_ratio,
         line=dict(
             color="gray",
@@ -288,7 +406,7 @@ def create_student_teacher_chart(projected_data):
     
     # Add annotation for the threshold
     fig.add_annotation(
-        x=len(df) - 1,
+        x=len(scenarios) - 1,
         y=optimal_ratio + 0.5,
         text="Optimal Ratio (16:1)",
         showarrow=False,
@@ -303,89 +421,86 @@ def create_student_teacher_chart(projected_data):
         xaxis=dict(
             title='Scenario',
             tickmode='array',
-            tickvals=list(range(len(df))),
-            ticktext=df['SCENARIO']
+            tickvals=list(range(len(scenarios))),
+            ticktext=scenarios
         ),
         yaxis=dict(
             title='Student-Teacher Ratio',
-            range=[0, max(df['STUDENT_TEACHER_RATIO']) * 1.2]  # Add some padding
+            range=[0, ratios.max() * 1.2]  # Add some padding
         ),
         margin=dict(l=50, r=50, t=80, b=50),
         height=400,
     )
     
-    return fig
+    return fig.to_dict()
 
 def format_percentage(percentage):
     return f"{percentage:.1f}%"
 
-def create_employment_chart(projected_data):
-    # Make a copy of the dataframe to avoid modifying the original
-    df = projected_data.copy()
+@st.cache_data(show_spinner=False)
+def create_employment_chart(scenario_arrays):
+    scenarios = scenario_arrays.scenarios
+    employed = scenario_arrays.emp_pct
     
     # Calculate the unemployed percentage for each scenario
-    df['UNEMPLOYED_PERCENTAGE'] = 100 - df['TOTAL_EMPLOYED_PERCENTAGE']
-    
-    # Sort the dataframe by SCENARIO
-    df = df.sort_values('SCENARIO')
+    unemployed = 100 - employed
     
     # Define the NAIRU threshold
     nairu_threshold = 4.0
     
-    # Create figure with secondary y-axis
-    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    fig = go.Figure(_validate=False)
     
-    # Add traces for employed and unemployed percentages
-    for index, row in df.iterrows():
-        # Determine color for unemployed percentage bar
-        unemployed_color = '#E07069' if row['UNEMPLOYED_PERCENTAGE'] > nairu_threshold else '#F0D55D'
-        
-        # Add employed percentage bar
-        fig.add_trace(
-            go.Bar(
-                name='Employed',
-                y=[row['SCENARIO']],
-                x=[row['TOTAL_EMPLOYED_PERCENTAGE']],
-                orientation='h',
-                marker=dict(color='#509BC7'),
-                text=[format_percentage(row['TOTAL_EMPLOYED_PERCENTAGE'])],
-                textposition='inside',
-                hoverinfo='text',
-                hovertext=[f"Employed: {format_percentage(row['TOTAL_EMPLOYED_PERCENTAGE'])}"],
-                showlegend=index == 0  # Only show in legend for the first entry
-            )
+    # Color unemployed percentage bars above the threshold
+    unemployed_colors = np.where(unemployed > nairu_threshold, '#E07069', '#F0D55D')
+
+    employed_text = [format_percentage(p) for p in employed]
+    unemployed_text = [format_percentage(p) for p in unemployed]
+
+    # Add one stacked bar trace each for the employed and unemployed percentages
+    fig.add_trace(
+        go.Bar(
+            name='Employed',
+            y=scenarios,
+            x=employed,
+            orientation='h',
+            marker=dict(color='#509BC7'),
+            text=employed_text,
+            textposition='inside',
+            hoverinfo='text',
+            hovertext=[f"Employed: {text}" for text in employed_text],
+            _validate=False,
         )
-        
-        # Add unemployed percentage bar
-        fig.add_trace(
-            go.Bar(
-                name='Unemployed',
-                y=[row['SCENARIO']],
-                x=[row['UNEMPLOYED_PERCENTAGE']],
-                orientation='h',
-                marker=dict(color=unemployed_color),
-                text=[format_percentage(row['UNEMPLOYED_PERCENTAGE'])],
-                textposition='inside',
-                hoverinfo='text',
-                hovertext=[f"Unemployed: {format_percentage(row['UNEMPLOYED_PERCENTAGE'])}"],
-                showlegend=index == 0  # Only show in legend for the first entry
-            )
+    )
+
+    fig.add_trace(
+        go.Bar(
+            name='Unemployed',
+            y=scenarios,
+            x=unemployed,
+            orientation='h',
+            marker=dict(color=unemployed_colors.tolist()),
+            text=unemployed_text,
+            textposition='inside',
+            hoverinfo='text',
+            hovertext=[f"Unemployed: {text}" for text in unemployed_text],
+            _validate=False,
         )
+    )
     
     # Add NAIRU threshold line
     fig.add_trace(
         go.Scatter(
             name='NAIRU Threshold (4%)',
             x=[nairu_threshold],
-            y=df['SCENARIO'],
+            y=scenarios,
             mode='lines',
             line=dict(color='gray', width=2, dash='dash'),
             opacity=0.8,
             hoverinfo='text',
             hovertext=['NAIRU Threshold: 4%'],
-            showlegend=True
-        ),
-        secondary_y=False
+            showlegend=True,
+            _validate=False
+        )
     )
     
     # Update layout
@@ -401,7 +516,7 @@ def create_employment_chart(projected_data):
         yaxis=dict(
             title='Scenario',
             categoryorder='array',
-            categoryarray=df['SCENARIO'].tolist()
+            categoryarray=scenarios.tolist()
         ),
         legend=dict(
             orientation='h',
@@ -414,7 +529,7 @@ def create_employment_chart(projected_data):
         height=400,
     )
     
-    return fig
+    return fig.to_dict()
 
 def feature_cards(items):
     """
@@ -426,43 +541,7 @@ def feature_cards(items):
         - title: Card title
         - description: Card description
     """
-    # Add CSS for card styling
-    st.markdown("""
-    <style>
-        .card-grid {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 16px;
-            margin: 24px 0;
-        }
-        .feature-card {
-            flex: 1;
-            min-width: 200px;
-            background-color: blue;
-            border: 1px solid rgba(49, 51, 63, 0.2);
-            border-radius: 8px;
-            padding: 20px;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-            transition: transform 0.3s ease, box-shadow 0.3s ease;
-        }
-        .feature-card:hover {
-            transform: translateY(-4px);
-            box-shadow: 0 8px 15px rgba(0,0,0,0.1);
-        }
-        .card-title {
-            font-weight: bold;
-            font-size: 1.1rem;
-            margin-bottom: 10px;
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }
-        .card-description {
-            color: #666;
-        }
-    </style>
-    """, unsafe_allow_html=True)
-
+    # Card styling is defined once in app/assets/styles.css
     # Create columns for the cards
     cols = st.columns(len(items))
 
@@ -483,112 +562,67 @@ def feature_cards(items):
                 # Add spacing
                 st.markdown("<br>", unsafe_allow_html=True)
 
-                # Apply card styling to this container
-                st.markdown("""
-                <style>
-                    div[data-testid="column"] > div:first-child {
-                        background-color: white;
-                        border: 1px solid rgba(49, 51, 63, 0.2);
-                        border-radius: 8px;
-                        padding: 16px;
-                        height: 100%;
-                        box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-                        transition: transform 0.3s ease, box-shadow 0.3s ease;
-                    }
-                    div[data-testid="column"] > div:first-child:hover {
-                        transform: translateY(-4px);
-                        box-shadow: 0 8px 15px rgba(0,0,0,0.1);
-                    }
-                    
-                    div[data-testid="column"] h3 {
-                        margin-top: 4px;
-                        margin-bottom: 4px;
-                        padding-top: 0;
-                        padding-bottom: 0;
-                    }
-                </style>
-                """, unsafe_allow_html=True)
-
-
-def display_population_projections(county_name, state_name, county_fips, population_historical, population_projections):
-    st.write(f"### Population Projections for {county_name}, {state_name}")
 
-    county_pop_historical = population_historical.loc[county_fips]
+@lru_cache(maxsize=None)
+def _year_index(years):
+    """Convert a tuple of year labels to an integer index, parsing each distinct tuple once."""
+    # Every label is a plain four-digit year, so an integer parse is enough for the chart's x-axis
+    return pd.Index(years).astype(int)
 
-    # If the county has multiple rows of data, select the row with the most complete data
-    if county_pop_historical.shape[0] > 1:
-        # Count the number of missing values in each row
-        missing_counts = county_pop_historical.isna().sum(axis=1)
 
-        # Get the index of the row with the minimum number of missing values
-        min_missing_idx = missing_counts.idxmin()
+@st.cache_data(show_spinner=False)
+def create_population_projection_chart(county_fips):
+    # Historical rows are deduplicated at load, so each county has exactly one
+    county_pop_historical = _pop_hist().loc[county_fips]
 
-        county_pop_historical = county_pop_historical.loc[min_missing_idx]
+    county_pop_projections = _pop_proj().loc[county_fips]
 
-    county_pop_projections = population_projections.loc[county_fips]
+    # Drop the COUNTY_FIPS entry (if present) which would otherwise be included as a datapoint on the x-axis
+    county_pop_historical = county_pop_historical.drop('COUNTY_FIPS', errors='ignore')
 
-    # TODO: Rewrite to work with any number of scenarios that are included in the projections
-    scenarios = [
-        'POPULATION_2065_S3',
-        'POPULATION_2065_S5b',
-        'POPULATION_2065_S5a',
-        'POPULATION_2065_S5c',
-    ]
+    # Share the historical series across every scenario and end each line with its 2065 projection
+    years = _year_index(tuple(county_pop_historical.index) + ('2065',)).to_numpy()
+    history = county_pop_historical.to_numpy(dtype=np.float64)
 
-    scenario_labels = [
-        'Scenario S3',
-        'Scenario S5a',
-        'Scenario S5b',
-        'Scenario S5c'
-    ]
+    fig = go.Figure(layout=dict(template="dashboard"), _validate=False)
+    fig.add_traces([
+        go.Scattergl(**_line_xy(years, np.append(history, county_pop_projections[scenario])),
+                     mode="lines", name=label, _validate=False)
+        for scenario, label in zip(SCENARIOS, SCENARIO_LABELS)
+    ])
 
-    # Create a dictionary to store all projection scenarios
-    projections_dict = {}
+    return fig.to_dict()
 
-    # Add each projection scenario to the dictionary
-    for scenario, label in zip(scenarios, scenario_labels):
-        # Get the projected 2065 population for this scenario
-        projected_pop_2065 = county_pop_projections[scenario]
 
-        # Create a copy of the historical data for this scenario
-        scenario_data = county_pop_historical.copy()
-
-        # Add the 2065 projection to this scenario's data
-        scenario_data['2065'] = projected_pop_2065
-
-        # Add this scenario to the main dictionary
-        projections_dict[label] = scenario_data
-
-        # Convert the dictionary to a DataFrame with scenarios as the index
+def display_population_projections(county_name, state_name, county_fips):
+    st.write(f"### Population Projections for {county_name}, {state_name}")
 
-    projection_df = pd.DataFrame(projections_dict)
+    # Create the chart
+    st.plotly_chart(create_population_projection_chart(county_fips),
+                    use_container_width=True, config=PLOTLY_CONFIG)
 
-    # Drop the COUNTY_FIPS column which would otherwise be included as a datapoint on the x-axis
-    projection_df = projection_df.drop(index='COUNTY_FIPS')
-    projection_df = projection_df.set_index(
-        pd.to_datetime(projection_df.index, format='%Y'))
 
-    # Create the chart
-    st.line_chart(projection_df)
+def display_migration_impact_analysis(projections_dict, scenario, county_fips):
+    # Reuse metrics already computed this session for the same county and scenario
+    metrics_cache = st.session_state.setdefault('_impact_metrics', {})
+    metrics = metrics_cache.get((county_fips, scenario))
 
+    if metrics is None:
+        # Calculate metrics based on selected scenario vs baseline
+        baseline_pop_2065 = projections_dict["POPULATION_2065_S3"]
+        selected_pop_2065 = projections_dict[scenario]
 
-def display_migration_impact_analysis(projections_dict, scenario):
-    impact_map = {
-        "Scenario S5b": "Low",
-        "Scenario S5a": "Medium",
-        "Scenario S5c": "High"
-    }
+        # Calculate additional residents (difference between selected scenario and baseline)
+        additional_residents = int(selected_pop_2065 - baseline_pop_2065)
 
-    # Calculate metrics based on selected scenario vs baseline
-    baseline_pop_2065 = projections_dict["POPULATION_2065_S3"]
-    selected_pop_2065 = projections_dict[scenario]
+        # Calculate percentage increase relative to baseline
+        percent_increase = round(
+            (additional_residents / baseline_pop_2065) * 100, 1)
 
-    # Calculate additional residents (difference between selected scenario and baseline)
-    additional_residents = int(selected_pop_2065 - baseline_pop_2065)
+        metrics = metrics_cache[(county_fips, scenario)] = (
+            selected_pop_2065, additional_residents, percent_increase)
 
-    # Calculate percentage increase relative to baseline
-    percent_increase = round(
-        (additional_residents / baseline_pop_2065) * 100, 1)
+    selected_pop_2065, additional_residents, percent_increase = metrics
 
     # Display metrics in same row
     split_row(
@@ -606,59 +640,76 @@ def display_migration_impact_analysis(projections_dict, scenario):
     )
 
 
+def _show_chart(key, default=False):
+    """Toggle gating a chart section, so its data and figure are only built once the user opens it."""
+    return st.toggle("Show chart", value=default, key=key)
+
+
+@st.cache_data(show_spinner=False)
+def create_housing_indicators_chart(county_fips):
+    # Retrieve every housing indicator charted below in one query
+    housing_data = database.get_stat_vars(
+        Table.COUNTY_HOUSING_DATA,
+        [column for column, _ in HOUSING_INDICATORS],
+        county_fips=county_fips)
+
+    # One panel per indicator in a 2x2 grid, so the page renders a single chart component
+    fig = make_subplots(rows=2, cols=2,
+                        subplot_titles=[title for _, title in HOUSING_INDICATORS])
+
+    for i, (column, title) in enumerate(HOUSING_INDICATORS):
+        fig.add_trace(
+            go.Scattergl(**_line_xy(housing_data.index, housing_data[column]),
+                         mode="lines", name=title, _validate=False),
+            row=i // 2 + 1, col=i % 2 + 1)
+
+    fig.update_layout(template="dashboard", showlegend=False)
+
+    return fig.to_dict()
+
+
 def display_housing_indicators(county_name, state_name, county_fips):
     st.header('Housing Analysis')
 
-    st.write(f"### Median Gross Rent for {county_name}, {state_name}")
-    st.line_chart(database.get_stat_var(Table.COUNTY_HOUSING_DATA,
-                  "MEDIAN_GROSS_RENT", county_fips=county_fips))
+    # Housing is the primary indicator chart, so it renders on first load; the user can still hide it
+    if not _show_chart("show_housing_chart", default=True):
+        return
+
+    st.write(f"### Housing Indicators for {county_name}, {state_name}")
+    st.plotly_chart(create_housing_indicators_chart(county_fips), use_container_width=True, config=PLOTLY_CONFIG)
+
 
-    st.write(f"### Median House Value for {county_name}, {state_name}")
-    st.line_chart(database.get_stat_var(Table.COUNTY_HOUSING_DATA,
-                  "MEDIAN_HOUSING_VALUE", county_fips=county_fips))
+@st.cache_data(ttl=3600, max_entries=512, show_spinner=False)
+def _load_education(county_fips):
+    """Every education table column charted on the page for one county, fetched in a single query."""
+    indicators = ([f"{indicator}_UNEMPLOYED" for _, indicator in EDUCATION_LEVELS] +
+                  [f"{indicator}_TOTAL" for _, indicator in EDUCATION_LEVELS] +
+                  ["TOTAL_POPULATION_25_64"])
+    return database.get_stat_vars(
+        Table.COUNTY_EDUCATION_DATA, indicators, county_fips=county_fips)
 
-    st.write(f"### Total Housing Units for {county_name}, {state_name}")
-    st.line_chart(database.get_stat_var(Table.COUNTY_HOUSING_DATA,
-                  "TOTAL_HOUSING_UNITS", county_fips=county_fips))
 
-    st.write(f"### Occupied Housing Units for {county_name}, {state_name}")
-    st.line_chart(database.get_stat_var(Table.COUNTY_HOUSING_DATA,
-                  "OCCUPIED_HOUSING_UNITS", county_fips=county_fips))
+def _line_xy(x, y):
+    """Line trace x/y arguments, downsampled with LTTB once a series outgrows what is worth drawing."""
+    x, y = lttb_downsample(x, y)
+    return dict(x=x, y=y)
 
 
 def display_education_indicators(county_name, state_name, county_fips):
     st.header('Education Analysis')
 
-    # Retrieve all the educational attainment data needed for the chart
-    less_than_hs_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "LESS_THAN_HIGH_SCHOOL_TOTAL", county_fips=county_fips)
-    hs_graduate_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "HIGH_SCHOOL_GRADUATE_TOTAL", county_fips=county_fips)
-    some_college_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "SOME_COLLEGE_TOTAL", county_fips=county_fips)
-    bachelors_higher_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "BACHELORS_OR_HIGHER_TOTAL", county_fips=county_fips)
-    total_pop_25_64_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "TOTAL_POPULATION_25_64", county_fips=county_fips)
-
-    # Combine all dataframes into one
-    final_df = pd.DataFrame()
-    final_df["YEAR"] = less_than_hs_df.index
-    final_df["LESS_THAN_HIGH_SCHOOL_TOTAL"] = less_than_hs_df.values
-    final_df["HIGH_SCHOOL_GRADUATE_TOTAL"] = hs_graduate_df.values
-    final_df["SOME_COLLEGE_TOTAL"] = some_college_df.values
-    final_df["BACHELORS_OR_HIGHER_TOTAL"] = bachelors_higher_df.values
-    final_df["TOTAL_POPULATION_25_64"] = total_pop_25_64_df.values
-
-    # Calculate percentages
-    final_df["LessThanHighSchool_Perc"] = (
-        final_df["LESS_THAN_HIGH_SCHOOL_TOTAL"] / final_df["TOTAL_POPULATION_25_64"]) * 100
-    final_df["HighSchoolGraduate_Perc"] = (
-        final_df["HIGH_SCHOOL_GRADUATE_TOTAL"] / final_df["TOTAL_POPULATION_25_64"]) * 100
-    final_df["SomeCollege_Perc"] = (
-        final_df["SOME_COLLEGE_TOTAL"] / final_df["TOTAL_POPULATION_25_64"]) * 100
-    final_df["BachelorsOrHigher_Perc"] = (
-        final_df["BACHELORS_OR_HIGHER_TOTAL"] / final_df["TOTAL_POPULATION_25_64"]) * 100
+    # Skip building the chart until the section is opened
+    if not _show_chart("show_education_chart"):
+        return
+
+    # Take the educational attainment data needed for the chart from the shared education fetch
+    attainment_columns = [column for column, _, _ in EDUCATION_ATTAINMENT_TRACES]
+    final_df = _load_education(county_fips)[
+        attainment_columns + ["TOTAL_POPULATION_25_64"]].reset_index()
+
+    # Calculate all attainment percentages in a single division
+    attainment_perc = dict(zip(attainment_columns, pct_of_total(
+        final_df[attainment_columns], final_df["TOTAL_POPULATION_25_64"]).T))
 
     # Create a title for the chart
     st.write(
@@ -667,269 +718,228 @@ def display_education_indicators(county_name, state_name, county_fips):
     # Since Streamlit doesn't natively support dual-axis charts, we'll use Plotly
 
     # Create a figure with secondary y-axis
-    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    fig = go.Figure(layout=SECONDARY_Y_LAYOUT, _validate=False)
+
+    # Traces for educational attainment percentages (left y-axis)
+    traces = [
+        go.Scattergl(**_line_xy(final_df["YEAR"], attainment_perc[column]),
+                     mode="lines+markers", name=name,
+                     marker=dict(symbol=symbol), _validate=False)
+        for column, name, symbol in EDUCATION_ATTAINMENT_TRACES
+    ]
 
-    # Add traces for educational attainment percentages (left y-axis)
-    fig.add_trace(
-        go.Scatter(x=final_df["YEAR"], y=final_df["LessThanHighSchool_Perc"],
-                   mode="lines+markers", name="Less than High School (%)",
-                   marker=dict(symbol="circle")),
-        secondary_y=False
+    # Trace for total population (right y-axis)
+    traces.append(
+        go.Scattergl(**_line_xy(final_df["YEAR"], final_df["TOTAL_POPULATION_25_64"]),
+                     mode="lines+markers", name="Total Population (25-64)",
+                     line=dict(dash="dash", color="black"),
+                     marker=dict(symbol="star", color="black"),
+                     yaxis="y2", _validate=False)
     )
 
-    fig.add_trace(
-        go.Scatter(x=final_df["YEAR"], y=final_df["HighSchoolGraduate_Perc"],
-                   mode="lines+markers", name="High School Graduate (%)",
-                   marker=dict(symbol="square")),
-        secondary_y=False
-    )
+    fig.add_traces(traces)
 
-    fig.add_trace(
-        go.Scatter(x=final_df["YEAR"], y=final_df["SomeCollege_Perc"],
-                   mode="lines+markers", name="Some College or Associate's Degree (%)",
-                   marker=dict(symbol="triangle-up")),
-        secondary_y=False
+    # Set axis titles
+    fig.update_xaxes(title_text="YEAR")
+    fig.update_layout(
+        template="dashboard",
+        yaxis_title_text="Percentage of Population (25-64)",
+        yaxis2_title_text="Total Population (25-64)",
     )
 
-    fig.add_trace(
-        go.Scatter(x=final_df["YEAR"], y=final_df["BachelorsOrHigher_Perc"],
-                   mode="lines+markers", name="Bachelor's Degree or Higher (%)",
-                   marker=dict(symbol="diamond")),
-        secondary_y=False
-    )
+    # Display the chart
+    st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+
+
+@st.cache_data(show_spinner=False)
+def create_unemployment_chart(county_fips):
+    # Retrieve the unemployment data needed for the chart in one query
+    total_unemployment = database.get_stat_vars(
+        Table.COUNTY_ECONOMIC_DATA,
+        ["TOTAL_LABOR_FORCE", "UNEMPLOYED_PERSONS", "UNEMPLOYMENT_RATE"],
+        county_fips=county_fips
+    ).reset_index().rename(columns={
+        "TOTAL_LABOR_FORCE": "TotalLaborForce",
+        "UNEMPLOYED_PERSONS": "TotalUnemployed",
+        "UNEMPLOYMENT_RATE": "UnemploymentRate",
+    })
+
+    # Downcast before plotting so the figure payload sent to the browser is smaller
+    total_unemployment = total_unemployment.astype({
+        "YEAR": np.int16,
+        "TotalLaborForce": np.float32,
+        "TotalUnemployed": np.float32,
+        "UnemploymentRate": np.float32,
+    })
 
-    # Add trace for total population (right y-axis)
-    fig.add_trace(
-        go.Scatter(x=final_df["YEAR"], y=final_df["TOTAL_POPULATION_25_64"],
-                   mode="lines+markers", name="Total Population (25-64)",
-                   line=dict(dash="dash", color="black"),
-                   marker=dict(symbol="star", color="black")),
-        secondary_y=True
-    )
+    # Create a figure with secondary y-axis using Plotly
+    fig = go.Figure(layout=SECONDARY_Y_LAYOUT, _validate=False)
+
+    fig.add_traces([
+        # Total Labor Force (left y-axis)
+        go.Scattergl(**_line_xy(total_unemployment["YEAR"], total_unemployment["TotalLaborForce"]),
+                     mode="lines+markers", name="Total Labor Force",
+                     line=dict(color="blue"),
+                     marker=dict(symbol="circle", color="blue"), _validate=False),
+        # Total Unemployed (left y-axis)
+        go.Scattergl(**_line_xy(total_unemployment["YEAR"], total_unemployment["TotalUnemployed"]),
+                     mode="lines+markers", name="Total Unemployed",
+                     line=dict(color="red"),
+                     marker=dict(symbol="square", color="red"), _validate=False),
+        # Unemployment Rate (right y-axis)
+        go.Scattergl(**_line_xy(total_unemployment["YEAR"], total_unemployment["UnemploymentRate"]),
+                     mode="lines+markers", name="Unemployment Rate (%)",
+                     line=dict(dash="dash", color="green"),
+                     marker=dict(symbol="triangle-up", color="green"),
+                     yaxis="y2", _validate=False),
+    ])
 
     # Set axis titles
     fig.update_xaxes(title_text="YEAR")
-    fig.update_yaxes(
-        title_text="Percentage of Population (25-64)", secondary_y=False)
-    fig.update_yaxes(title_text="Total Population (25-64)", secondary_y=True)
-
     fig.update_layout(
-        xaxis=dict(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.1)'),
-        yaxis=dict(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.1)'),
-        legend=dict(
-            orientation="h",  # Horizontal legend
-            yanchor="bottom",
-            y=-0.3,  # Position below the plot
-            xanchor="center",
-            x=0.5    # Center the legend horizontally
-        ),
-        # Increased bottom margin to accommodate legend
-        margin=dict(l=40, r=40, t=40, b=100),
-        autosize=True,
+        template="dashboard",
+        yaxis_title_text="Number of People",
+        yaxis2=dict(title_text="Unemployment Rate (%)", color="green"),
     )
 
-    # Display the chart
-    st.plotly_chart(fig, use_container_width=True)
+    return fig.to_dict()
 
 
+@st.fragment
 def display_unemployment_indicators(county_name, state_name, county_fips):
     st.header('Unemployment Analysis')
 
-    # Retrieve the unemployment data needed for the chart
-    # Using the same pattern as your education function but with economic data table
-    total_labor_force_df = database.get_stat_var(
-        Table.COUNTY_ECONOMIC_DATA, "TOTAL_LABOR_FORCE", county_fips=county_fips)
-    unemployed_persons_df = database.get_stat_var(
-        Table.COUNTY_ECONOMIC_DATA, "UNEMPLOYED_PERSONS", county_fips=county_fips)
-    unemployment_rate_df = database.get_stat_var(
-        Table.COUNTY_ECONOMIC_DATA, "UNEMPLOYMENT_RATE", county_fips=county_fips)
-
-    # Combine all dataframes into one
-    total_unemployment = pd.DataFrame()
-    total_unemployment["YEAR"] = total_labor_force_df.index
-    total_unemployment["TotalLaborForce"] = total_labor_force_df.values
-    total_unemployment["TotalUnemployed"] = unemployed_persons_df.values
-    total_unemployment["UnemploymentRate"] = unemployment_rate_df.values
+    # Skip building the chart until the section is opened
+    if not _show_chart("show_unemployment_chart"):
+        return
 
     # Create a title for the chart
     st.write(
         f"###### Total Labor Force, Unemployed Population, and Unemployment Rate (2011-2023)")
 
-    # Create a figure with secondary y-axis using Plotly
-    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    # Display the chart
+    st.plotly_chart(create_unemployment_chart(county_fips), use_container_width=True, config=PLOTLY_CONFIG)
 
-    # Add trace for Total Labor Force (left y-axis)
-    fig.add_trace(
-        go.Scatter(x=total_unemployment["YEAR"], y=total_unemployment["TotalLaborForce"],
-                   mode="lines+markers", name="Total Labor Force",
-                   line=dict(color="blue"),
-                   marker=dict(symbol="circle", color="blue")),
-        secondary_y=False
-    )
 
-    # Add trace for Total Unemployed (left y-axis)
-    fig.add_trace(
-        go.Scatter(x=total_unemployment["YEAR"], y=total_unemployment["TotalUnemployed"],
-                   mode="lines+markers", name="Total Unemployed",
-                   line=dict(color="red"),
-                   marker=dict(symbol="square", color="red")),
-        secondary_y=False
-    )
+@st.cache_data(ttl=3600, max_entries=512, show_spinner=False)
+def _load_education_unemployment(county_fips):
+    """Assemble YEAR plus unemployed, total and unemployment rate arrays per education level for one county."""
+    prefixes = [prefix for prefix, _ in EDUCATION_LEVELS]
+    unemployed_columns = [f"{prefix}_Unemployed" for prefix in prefixes]
+    total_columns = [f"{prefix}_Total" for prefix in prefixes]
+    rate_columns = [f"{prefix}_UnemploymentRate" for prefix in prefixes]
 
-    # Add trace for Unemployment Rate (right y-axis)
-    fig.add_trace(
-        go.Scatter(x=total_unemployment["YEAR"], y=total_unemployment["UnemploymentRate"],
-                   mode="lines+markers", name="Unemployment Rate (%)",
-                   line=dict(dash="dash", color="green"),
-                   marker=dict(symbol="triangle-up", color="green")),
-        secondary_y=True
-    )
+    # Take raw unemployed and total population counts for every education level from the shared education fetch
+    indicators = ([f"{indicator}_UNEMPLOYED" for _, indicator in EDUCATION_LEVELS] +
+                  [f"{indicator}_TOTAL" for _, indicator in EDUCATION_LEVELS])
+    counts = _load_education(county_fips)[indicators]
 
-    # Set axis titles
-    fig.update_xaxes(title_text="YEAR")
-    fig.update_yaxes(title_text="Number of People", secondary_y=False)
-    fig.update_yaxes(title_text="Unemployment Rate (%)",
-                     secondary_y=True, color="green")
+    # Work on all eight count columns as a single float block
+    values = counts.to_numpy(dtype=np.float64)
+    unemployed, total = values[:, :len(prefixes)], values[:, len(prefixes):]
 
-    # Update layout to match the matplotlib style
-    fig.update_layout(
-        xaxis=dict(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.1)'),
-        yaxis=dict(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.1)'),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=-0.3,
-            xanchor="center",
-            x=0.5
-        ),
-        margin=dict(l=40, r=40, t=40, b=100),
-        autosize=True,
-    )
+    # Calculate every unemployment rate in one division, leaving levels with no population at 0%
+    rates = pct_of_total(unemployed, total)
 
-    # Display the chart
-    st.plotly_chart(fig, use_container_width=True)
+    # Plotly takes the arrays directly, so skip building a DataFrame
+    unemployment_by_edulevel = {"YEAR": counts.index.to_numpy(dtype=np.int16)}
+    unemployment_by_edulevel.update(zip(unemployed_columns + total_columns, values.T))
 
+    # The plotted rates go to the browser as float32 to halve their payload
+    unemployment_by_edulevel.update(zip(rate_columns, rates.astype(np.float32).T))
 
-def display_unemployment_by_education(county_name, state_name, county_fips):
-    st.header('Unemployment by Education Level')
+    return unemployment_by_edulevel
 
-    # Retrieve raw counts for each education level - both unemployed and total population
-    # Unemployed counts
-    less_than_hs_unemployed_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "LESS_THAN_HIGH_SCHOOL_UNEMPLOYED", county_fips=county_fips)
-    hs_graduate_unemployed_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "HIGH_SCHOOL_GRADUATE_UNEMPLOYED", county_fips=county_fips)
-    some_college_unemployed_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "SOME_COLLEGE_UNEMPLOYED", county_fips=county_fips)
-    bachelors_higher_unemployed_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "BACHELORS_OR_HIGHER_UNEMPLOYED", county_fips=county_fips)
-
-    # Total population counts
-    less_than_hs_total_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "LESS_THAN_HIGH_SCHOOL_TOTAL", county_fips=county_fips)
-    hs_graduate_total_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "HIGH_SCHOOL_GRADUATE_TOTAL", county_fips=county_fips)
-    some_college_total_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "SOME_COLLEGE_TOTAL", county_fips=county_fips)
-    bachelors_higher_total_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "BACHELORS_OR_HIGHER_TOTAL", county_fips=county_fips)
-
-    # Combine all dataframes into one
-    unemployment_by_edulevel = pd.DataFrame()
-    unemployment_by_edulevel["YEAR"] = less_than_hs_unemployed_df.index
-
-    # Store raw counts
-    unemployment_by_edulevel["LessThanHighSchool_Unemployed"] = less_than_hs_unemployed_df.values
-    unemployment_by_edulevel["HighSchoolGraduate_Unemployed"] = hs_graduate_unemployed_df.values
-    unemployment_by_edulevel["SomeCollege_Unemployed"] = some_college_unemployed_df.values
-    unemployment_by_edulevel["BachelorsOrHigher_Unemployed"] = bachelors_higher_unemployed_df.values
-
-    unemployment_by_edulevel["LessThanHighSchool_Total"] = less_than_hs_total_df.values
-    unemployment_by_edulevel["HighSchoolGraduate_Total"] = hs_graduate_total_df.values
-    unemployment_by_edulevel["SomeCollege_Total"] = some_college_total_df.values
-    unemployment_by_edulevel["BachelorsOrHigher_Total"] = bachelors_higher_total_df.values
-
-    # Calculate unemployment rates by dividing unemployed by total population
-    unemployment_by_edulevel["LessThanHighSchool_UnemploymentRate"] = (
-        unemployment_by_edulevel["LessThanHighSchool_Unemployed"] /
-        unemployment_by_edulevel["LessThanHighSchool_Total"] * 100
-    )
 
-    unemployment_by_edulevel["HighSchoolGraduate_UnemploymentRate"] = (
-        unemployment_by_edulevel["HighSchoolGraduate_Unemployed"] /
-        unemployment_by_edulevel["HighSchoolGraduate_Total"] * 100
-    )
+@st.cache_data(show_spinner=False)
+def create_unemployment_by_education_chart(county_fips):
+    unemployment_by_edulevel = _load_education_unemployment(county_fips)
 
-    unemployment_by_edulevel["SomeCollege_UnemploymentRate"] = (
-        unemployment_by_edulevel["SomeCollege_Unemployed"] /
-        unemployment_by_edulevel["SomeCollege_Total"] * 100
-    )
+    # Create a figure using Plotly
+    fig = go.Figure(layout=dict(template="dashboard"), _validate=False)
 
-    unemployment_by_edulevel["BachelorsOrHigher_UnemploymentRate"] = (
-        unemployment_by_edulevel["BachelorsOrHigher_Unemployed"] /
-        unemployment_by_edulevel["BachelorsOrHigher_Total"] * 100
-    )
+    # Add traces for each education level's unemployment rate
+    fig.add_traces([
+        go.Scattergl(**_line_xy(unemployment_by_edulevel["YEAR"],
+                                unemployment_by_edulevel[f"{prefix}_UnemploymentRate"]),
+                     mode="lines+markers",
+                     name=name,
+                     marker=dict(symbol=symbol), _validate=False)
+        for prefix, name, symbol in EDUCATION_UNEMPLOYMENT_TRACES
+    ])
+
+    # Set axis titles
+    fig.update_xaxes(title_text="YEAR")
+    fig.update_yaxes(title_text="Unemployment Rate (%)")
+
+    return fig.to_dict()
+
+
+@st.fragment
+def display_unemployment_by_education(county_name, state_name, county_fips):
+    st.header('Unemployment by Education Level')
+
+    # Skip building the chart until the section is opened
+    if not _show_chart("show_unemployment_by_education_chart"):
+        return
 
     # Create a title for the chart
     st.write(
         f"###### Unemployment Rate by Education Level (2011-2023)")
 
-    # Create a figure using Plotly
-    fig = go.Figure()
+    # Display the chart
+    st.plotly_chart(create_unemployment_by_education_chart(county_fips), use_container_width=True, config=PLOTLY_CONFIG)
 
-    # Add traces for each education level's unemployment rate
-    fig.add_trace(
-        go.Scatter(x=unemployment_by_edulevel["YEAR"],
-                   y=unemployment_by_edulevel["LessThanHighSchool_UnemploymentRate"],
-                   mode="lines+markers",
-                   name="Less Than High School",
-                   marker=dict(symbol="circle"))
-    )
 
-    fig.add_trace(
-        go.Scatter(x=unemployment_by_edulevel["YEAR"],
-                   y=unemployment_by_edulevel["HighSchoolGraduate_UnemploymentRate"],
-                   mode="lines+markers",
-                   name="High School Graduate",
-                   marker=dict(symbol="square"))
-    )
+# The page-level frames below are cache_resource rather than cache_data: every rerun reads them, and
+# cache_data would unpickle a full copy of each table per hit. Callers must treat them as read-only.
+@st.cache_resource(ttl=3600, show_spinner=False)
+def _counties():
+    # The page only needs names; the WKT geometry is most of the table's size and is left to the maps
+    counties = (database.prefetch_startup()['counties']
+                .drop(columns='geometry', errors='ignore')
+                .set_index('COUNTY_FIPS'))
 
-    fig.add_trace(
-        go.Scatter(x=unemployment_by_edulevel["YEAR"],
-                   y=unemployment_by_edulevel["SomeCollege_UnemploymentRate"],
-                   mode="lines+markers",
-                   name="Some College or Associate's Degree",
-                   marker=dict(symbol="triangle-up"))
-    )
+    # Split "County, State" names once so lookups are plain label reads
+    counties[['COUNTY', 'STATE']] = counties['NAME'].str.split(', ', n=1, expand=True)
 
-    fig.add_trace(
-        go.Scatter(x=unemployment_by_edulevel["YEAR"],
-                   y=unemployment_by_edulevel["BachelorsOrHigher_UnemploymentRate"],
-                   mode="lines+markers",
-                   name="Bachelor's Degree or Higher",
-                   marker=dict(symbol="diamond"))
-    )
+    return counties
 
-    # Set axis titles and layout
-    fig.update_xaxes(title_text="YEAR")
-    fig.update_yaxes(title_text="Unemployment Rate (%)")
 
-    fig.update_layout(
-        xaxis=dict(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.1)'),
-        yaxis=dict(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.1)'),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=-0.3,
-            xanchor="center",
-            x=0.5
-        ),
-        margin=dict(l=40, r=40, t=40, b=100),
-        autosize=True,
-    )
+@st.cache_resource(ttl=3600, show_spinner=False)
+def _county_labels():
+    """Map each county FIPS to its display name for the county selectbox."""
+    counties = _counties()
+    return dict(zip(counties.index.tolist(), counties['NAME'].tolist()))
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _county_position(county_fips):
+    """Return the position of a county FIPS among the county selectbox options."""
+    return _counties().index.get_loc(county_fips)
 
-    # Display the chart
-    st.plotly_chart(fig, use_container_width=True)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _county_names(county_fips):
+    """Return the (county, state) name pair for a county FIPS code."""
+    county_name, state_name = _counties().loc[county_fips, ['COUNTY', 'STATE']]
+    return county_name, state_name
+
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def _pop_hist():
+    population_historical = database.prefetch_startup()['population_historical']
+
+    # Some counties have several history rows; keep only the most complete one for each
+    completeness = population_historical.notna().to_numpy().sum(axis=1)
+    most_complete = population_historical.iloc[np.argsort(-completeness, kind='stable')]
+
+    return most_complete.drop_duplicates('COUNTY_FIPS').sort_index().set_index('COUNTY_FIPS')
+
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def _pop_proj():
+    return database.prefetch_startup()['population_projections'].set_index('COUNTY_FIPS')
 
 
 ####################################################################################################
@@ -947,13 +957,10 @@ st.html(
 # Initialize the Database connection
 db_conn = get_db_connection()
 
-# Make all database calls using database instead of just db
-counties = database.get_county_metadata().set_index('COUNTY_FIPS')
-
-population_historical = database.get_population_timeseries().set_index('COUNTY_FIPS')
+# The tables the whole page depends on are fetched in one cached round trip and indexed once
+counties = _counties()
 
-population_projections = database.get_population_projections_by_fips(
-).set_index('COUNTY_FIPS')
+population_projections = _pop_proj()
 
 selected_county_fips = '36029'
 
@@ -961,35 +968,35 @@ with st.sidebar:
     selected_county_fips = st.selectbox(
         'Select a county',
         counties.index,
-        format_func=lambda fips: counties['NAME'].loc[fips],
+        format_func=_county_labels().get,
         placeholder='Type to search...',
-        index=counties.index.get_loc(selected_county_fips)
+        index=_county_position(selected_county_fips)
     )
 
-    impact_map = {
-        # "POPULATION_2065_S3": "Baseline",
-        "POPULATION_2065_S5a": "Low",
-        "POPULATION_2065_S5b": "Medium",
-        "POPULATION_2065_S5c": "High"
-    }
-
     selected_scenario = st.selectbox(
         "Select a climate impact scenario:",
         # Exclude Scenario S3 (baseline)
-        options=list(impact_map.keys()),
-        format_func=lambda sel: impact_map.get(sel),
+        options=SCENARIO_OPTIONS,
+        format_func=SCENARIO_IMPACT_LEVELS.get,
         index=0
     )
 
     display_migration_impact_analysis(
         population_projections.loc[selected_county_fips],
-        selected_scenario
+        selected_scenario,
+        selected_county_fips
     )
     
     vertical_spacer(5)
 
     national_risk_score(selected_county_fips)
 
+# Get the County FIPS code, which will be used for all future queries
+if selected_county_fips:
+    # Separate the county and state names
+    county_name, state_name = _county_names(selected_county_fips)
+else:
+    county_name = state_name = selected_county_fips = None
 
 # Short paragraph explaining why climate migration will occur and how
 st.markdown("""
@@ -1026,15 +1033,6 @@ with st.expander("Read more about migration factors", icon=":material/article:")
 
 vertical_spacer(5)
 
-# Get the County FIPS code, which will be used for all future queries
-if selected_county_fips:
-    county_metadata = database.get_county_metadata().iloc[0]
-    # Separate the county and state names
-    full_name = county_metadata['NAME']
-    county_name, state_name = full_name.split(', ')
-else:
-    county_name = state_name = selected_county_fips = None
-
 if selected_county_fips:
     
     
@@ -1070,10 +1068,21 @@ if selected_county_fips:
     ######################################################################
     ######################################################################
     projected_data = database.get_table_for_county(Table.COUNTY_COMBINED_PROJECTIONS, selected_county_fips)
+
+    # Housing rates are used by several charts and checks, so calculate them once
+    occupied = projected_data['OCCUPIED_HOUSING_UNITS']
+    projected_data = projected_data.assign(
+        SCENARIO=_scenario_categorical(projected_data['SCENARIO']),
+        HOUSING_OCCUPANCY_RATE=occupied / (occupied + projected_data['AVAILABLE_HOUSING_UNITS']) * 100,
+        VACANCY_RATE=lambda df: 100 - df['HOUSING_OCCUPANCY_RATE'],
+    )
     # st.write(projected_data)
     
+    # Chart inputs are extracted from the projections once and shared by every chart
+    scenario_arrays = ScenarioArrays.from_frame(projected_data)
+
     # Display the impact analysis
-    display_scenario_impact_analysis(county_name, state_name, projected_data)
+    display_scenario_impact_analysis(county_name, state_name, projected_data, scenario_arrays)
     
     # Display policy recommendations
     generate_policy_recommendations(projected_data)
@@ -1083,7 +1092,7 @@ if selected_county_fips:
     
     # if not population_projections.empty:
     #     display_population_projections(
-    #         county_name, state_name, selected_county_fips, population_historical, population_projections)
+    #         county_name, state_name, selected_county_fips)
 
 
     # display_education_indicators(
@@ -1,52 +1,164 @@
+import os
+import logging
 import streamlit as st
+import numpy as np
 import pandas as pd
 
 from typing import List
 
 DATA_DIR = "../data/"
 
-def get_all_county_names():
+logger = logging.getLogger(__name__)
+
+@st.cache_data(show_spinner=False)
+def _load_counties():
+    # Parse the county names table once and share it across reruns and sessions
+    parquet_path = DATA_DIR + "raw/county_names.parquet"
+
+    # The Parquet copy (see preprocessing/cleaning/convert_csvs_to_parquet.py) stores padded FIPS strings
+    if os.path.exists(parquet_path):
+        counties = pd.read_parquet(parquet_path, engine="pyarrow")
+    else:
+        counties = pd.read_csv(DATA_DIR + "raw/county_names.csv", dtype={"COUNTY_FIPS": str}, engine="pyarrow")
+        counties["COUNTY_FIPS"] = counties.COUNTY_FIPS.str.zfill(5)
+
+    # Callers see the same plain string columns whichever file was read
+    return counties.astype({"COUNTY_FIPS": object, "COUNTY_NAME": object})
+
+@st.cache_data(show_spinner=False)
+def get_all_county_names() -> tuple:
     # import table containing county names and FIPS
-    counties = pd.read_csv(DATA_DIR + "raw/county_names.csv")
+    counties = _load_counties()
 
-    return counties.COUNTY_NAME
+    # A tuple of plain strings can go straight into a selectbox without any pandas machinery
+    return tuple(counties.COUNTY_NAME.tolist())
 
 def get_all_county_fips():
     # import table containing county names and FIPS
-    counties = pd.read_csv(DATA_DIR + "raw/county_names.csv")
+    counties = _load_counties()
 
     return counties.COUNTY_FIPS
 
+@st.cache_data(show_spinner=False)
+def _fips_index() -> dict:
+    # Map each county name to its first 5-digit FIPS code, matching the old first-search-result lookup
+    counties = _load_counties().drop_duplicates("COUNTY_NAME")
+
+    return dict(zip(counties.COUNTY_NAME, counties.COUNTY_FIPS))
+
 def get_county_fips_code(county_name: str) -> str:
-    # import table containing county names and FIPS
-    counties = pd.read_csv(DATA_DIR + "raw/county_names.csv")
-    
-    search_results = counties[counties.COUNTY_NAME == county_name]["COUNTY_FIPS"]
-    
-    # If there are no search results return None
-    if search_results.empty:
-        return None
+    # Returns None if there is no county with this name
+    return _fips_index().get(county_name)
 
-    # Get the first search result and format as a 5-digit code
-    fips_code = str(search_results.iloc[0]).zfill(5)
-    
-    return fips_code
+@st.cache_data(show_spinner=False)
+def _load_population_history():
+    # Without the Parquet copy, parse the whole CSV once and keep it for later lookups
+    return pd.read_csv(DATA_DIR + "decennial_county_population_data_1900_1990.csv", dtype=str)
 
 def get_county_population_history(county_fips: str) -> pd.DataFrame:
     if not county_fips:
         return None
     
-    print('Searching for county with FIPS code: ' + county_fips)
-    
-    df_population = pd.read_csv(DATA_DIR + "decennial_county_population_data_1900_1990.csv", dtype=str)
+    logger.debug("Searching for county with FIPS code: %s", county_fips)
+
+    parquet_path = DATA_DIR + "decennial_county_population_data_1900_1990.parquet"
+
+    # The Parquet copy is sorted by FIPS, so the filter only reads the row group holding this county
+    if os.path.exists(parquet_path):
+        df_population = pd.read_parquet(
+            parquet_path, engine="pyarrow", filters=[("fips", "=", county_fips)])
+    else:
+        df_population = _load_population_history()
+
     df_population = df_population.set_index('fips').drop(columns=['name'])
-    
-    print(df_population)
-    
+
     return df_population.loc[county_fips]
 
     
     
+def lttb_downsample(x, y, n_out=500):
+    """
+    Downsample a line series with the Largest-Triangle-Three-Buckets algorithm
+
+    Parameters:
+    -----------
+    x : array-like
+        Increasing x values of the series.
+    y : array-like
+        Y values matching x.
+    n_out : int
+        Number of points to keep (default: 500). Shorter series are returned unchanged.
+
+    Returns:
+    --------
+    x, y : numpy.ndarray
+        The selected points, always including the first and last ones
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+
+    if len(x) <= n_out or n_out < 3:
+        return x, y
+
+    x_float = x.astype(np.float64)
+    y_float = y.astype(np.float64)
+
+    # Keep the end points and split everything in between into n_out - 2 buckets
+    edges = np.linspace(1, len(x) - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, len(x) - 1
+
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+
+        # The next bucket's average (or the last point) is the triangle's third corner
+        if i < n_out - 3:
+            next_x = x_float[end:edges[i + 2]].mean()
+            next_y = y_float[end:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x_float[-1], y_float[-1]
+
+        # Keep the point in this bucket spanning the largest triangle with its neighbours
+        prev = selected[i]
+        areas = np.abs(
+            (x_float[prev] - next_x) * (y_float[start:end] - y_float[prev]) -
+            (x_float[prev] - x_float[start:end]) * (next_y - y_float[prev])
+        )
+        selected[i + 1] = start + np.argmax(areas)
+
+    return x[selected], y[selected]
+
+
+def pct_of_total(num, denom):
+    """
+    Express each value as a percentage of its total, leaving rows with a zero total at 0%
+
+    Parameters:
+    -----------
+    num : array-like
+        2-D block of counts, one column per series.
+    denom : array-like
+        Totals, either one per row or matching the shape of num.
+
+    Returns:
+    --------
+    numpy.ndarray
+        Float64 percentages with the shape of num
+    """
+    num = np.asarray(num, dtype=np.float64)
+    denom = np.asarray(denom, dtype=np.float64)
+
+    # A single total per row applies to every column of that row
+    if denom.ndim == 1:
+        denom = denom[:, None]
+    denom = np.broadcast_to(denom, num.shape)
+
+    out = np.zeros_like(num)
+    np.divide(num, denom, out=out, where=denom != 0)
+    out *= 100
+    return out
+
+
 def add_custom_css(file_path):
     with open(file_path) as f:
         st.html(f"<style>{f.read()}</style>")
\ No newline at end of file
@@ -5,6 +5,8 @@ import datacommons as dc
 from dotenv import load_dotenv
 from typing import List, Tuple, Dict, Optional
 import os
+import asyncio
+from functools import lru_cache
 import concurrent.futures
 import time
 
@@ -14,13 +16,13 @@ load_dotenv()
 CONFIG = {
     "US_CENSUS_API_KEY": os.getenv("US_CENSUS_API_KEY"),
     "BASE_DATA_DIR": Path("./data/raw"),
-    "EXCLUDED_STATES": [
+    "EXCLUDED_STATES": frozenset({
         "11",
         "72",
         "15",
         "02",
         "78",
-    ],  # DC, PR, HI, AK, VI as FIPS codes
+    }),  # DC, PR, HI, AK, VI as FIPS codes
     "DATASETS": {
         "HOUSING": {
             "DATASET": "acs/acs5/profile",
@@ -94,6 +96,39 @@ CONFIG = {
 }
 
 
+def _fetch_states_from_api(state_file: Path) -> pd.DataFrame:
+    """Download state names, drop excluded states and save them to state_file"""
+    state_df = ced.download(
+        "acs/acs5",
+        2010,
+        state="*",
+        download_variables=["NAME"],
+        api_key=CONFIG["US_CENSUS_API_KEY"],
+    )
+    # Filter out excluded states using FIPS codes
+    state_df = state_df[
+        ~state_df["STATE"].astype(str).isin(CONFIG["EXCLUDED_STATES"])
+    ]
+    state_df.to_csv(state_file, index=False)
+    return state_df
+
+
+@lru_cache(maxsize=None)
+def _load_contiguous_states() -> Tuple[str, ...]:
+    """Contiguous state codes, read once and shared by every DataDownloader"""
+    state_data_dir = CONFIG["BASE_DATA_DIR"] / "state_data"
+    state_data_dir.mkdir(parents=True, exist_ok=True)
+    state_file = state_data_dir / "state_names.csv"
+
+    # Use a freshly downloaded frame directly instead of reading back the file just written
+    if state_file.exists():
+        state_df = pd.read_csv(state_file)
+    else:
+        state_df = _fetch_states_from_api(state_file)
+
+    return tuple(state_df["STATE"].astype(str).str.zfill(2))
+
+
 class DataDownloader:
     def __init__(self):
         self._validate_api_key()
@@ -106,26 +141,7 @@ class DataDownloader:
 
     def _get_contiguous_states(self) -> List[str]:
         """Get list of contiguous state codes for all datasets"""
-        state_data_dir = CONFIG["BASE_DATA_DIR"] / "state_data"
-        state_data_dir.mkdir(parents=True, exist_ok=True)
-        state_file = state_data_dir / "state_names.csv"
-
-        if not state_file.exists():
-            state_df = ced.download(
-                "acs/acs5",
-                2010,
-                state="*",
-                download_variables=["NAME"],
-                api_key=CONFIG["US_CENSUS_API_KEY"],
-            )
-            # Filter out excluded states using FIPS codes
-            state_df = state_df[
-                ~state_df["STATE"].astype(str).isin(CONFIG["EXCLUDED_STATES"])
-            ]
-            state_df.to_csv(state_file, index=False)
-
-        state_df = pd.read_csv(state_file)
-        return state_df["STATE"].astype(str).str.zfill(2).tolist()
+        return list(_load_contiguous_states())
     
     def _get_counties_by_state(self) -> Dict[str, List[str]]:
         """Get a mapping of state codes to their county codes"""
@@ -221,29 +237,22 @@ class DataDownloader:
         except Exception as e:
             print(f"Failed {dataset} {year}: {str(e)}")
 
-    def _download_dataset(self, dataset: str) -> None:
-        """Parallel download handler for a dataset"""
-        dataset_config = CONFIG["DATASETS"][dataset]
-        
-        # Handle Data Commons datasets
-        if dataset_config.get("DATA_SOURCE") == "datacommons":
-            self._download_datacommons_dataset(dataset)
-            return
-
-        years = self._get_years_from_range(dataset_config["YEARS"])
+    async def _download_census_years(
+        self,
+        executor: concurrent.futures.Executor,
+        dataset_years: List[Tuple[str, int]]
+    ) -> None:
+        """Download (dataset, year) pairs concurrently, with at most MAX_WORKERS requests in flight"""
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(CONFIG["MAX_WORKERS"])
 
-        # Use concurrent futures for parallel downloading
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=CONFIG["MAX_WORKERS"]
-        ) as executor:
-            # Create a list of futures for each year
-            futures = [
-                executor.submit(self._download_single_dataset_year, dataset, year)
-                for year in years
-            ]
+        async def download(dataset: str, year: int) -> None:
+            async with semaphore:
+                # censusdis downloads are blocking, so each one runs on a worker thread
+                await loop.run_in_executor(
+                    executor, self._download_single_dataset_year, dataset, year)
 
-            # Wait for all futures to complete
-            concurrent.futures.wait(futures)
+        await asyncio.gather(*(download(dataset, year) for dataset, year in dataset_years))
 
     def _download_datacommons_dataset(self, dataset: str) -> None:
         """Generalized method to download data from Data Commons API"""
@@ -272,7 +281,7 @@ class DataDownloader:
         
         print(f"Downloading missing {dataset} data from Data Commons...")
         
-        # Create a dictionary to store all data (global to all threads)
+        # Create a dictionary to store all data (global to all threads), keyed by the years still to fetch
         all_data = {year: [] for year in years_range if year not in existing_files}
         
         # Process based on level (state or county)
@@ -297,8 +306,6 @@ class DataDownloader:
                             geo_id=f"geoId/{state_fips}",
                             variables=dataset_config["VARIABLES"],
                             all_data=all_data,
-                            years_range=years_range,
-                            existing_files=existing_files,
                             state=state_fips
                         )
                     )
@@ -330,8 +337,6 @@ class DataDownloader:
                             geo_id=geo_id,
                             variables=dataset_config["VARIABLES"],
                             all_data=all_data,
-                            years_range=years_range,
-                            existing_files=existing_files,
                             state=state_fips,
                             county=county_fips
                         )
@@ -365,8 +370,6 @@ class DataDownloader:
         geo_id: str, 
         variables: List[str], 
         all_data: Dict,
-        years_range: range,
-        existing_files: Dict,
         state: str,
         county: Optional[str] = None
     ) -> None:
@@ -393,11 +396,9 @@ class DataDownloader:
                         if county is None:  # Only print for state-level to reduce noise
                             print(f"Processing year {year_int} for {geo_id}, variable {variable}")
                         
-                        # Only process years that are within range and don't already exist in files
-                        if (
-                            year_int in years_range
-                            and year_int not in existing_files
-                        ):
+                        # all_data is keyed by exactly the in-range years without a file yet,
+                        # so one hash lookup replaces the range and existing-file checks
+                        if year_int in all_data:
                             entry = {
                                 "STATE": state,
                                 variable: value,
@@ -417,22 +418,39 @@ class DataDownloader:
             elif "404" not in str(e):  # Ignore common 404 errors for counties
                 print(f"Error for {geo_id}: {str(e)[:100]}...")
 
-    def download_all_data(self):
-        """Download all datasets with timing"""
-        start_time = time.time()
+    async def _download_all_data(self) -> None:
+        """Run every dataset's downloads in one event loop so the datasets overlap"""
+        census_years = []
+        datacommons_datasets = []
 
-        # Use concurrent futures for parallel dataset downloading
+        for dataset, dataset_config in CONFIG["DATASETS"].items():
+            if dataset_config.get("DATA_SOURCE") == "datacommons":
+                datacommons_datasets.append(dataset)
+            else:
+                census_years.extend(
+                    (dataset, year)
+                    for year in self._get_years_from_range(dataset_config["YEARS"])
+                )
+
+        loop = asyncio.get_running_loop()
+
+        # A dedicated pool with a thread per census request slot plus one per long-running
+        # Data Commons job, so those jobs never take a slot from the census downloads
         with concurrent.futures.ThreadPoolExecutor(
-            max_workers=CONFIG["MAX_WORKERS"]
+            max_workers=CONFIG["MAX_WORKERS"] + len(datacommons_datasets)
         ) as executor:
-            # Create a list of futures for each dataset
-            futures = [
-                executor.submit(self._download_dataset, dataset)
-                for dataset in CONFIG["DATASETS"]
-            ]
+            # All census (dataset, year) pairs share one bounded queue instead of a thread pool per dataset
+            await asyncio.gather(
+                self._download_census_years(executor, census_years),
+                *(loop.run_in_executor(executor, self._download_datacommons_dataset, dataset)
+                  for dataset in datacommons_datasets),
+            )
+
+    def download_all_data(self):
+        """Download all datasets with timing"""
+        start_time = time.time()
 
-            # Wait for all futures to complete
-            concurrent.futures.wait(futures)
+        asyncio.run(self._download_all_data())
 
         end_time = time.time()
         print(f"Total download time: {end_time - start_time:.2f} seconds")
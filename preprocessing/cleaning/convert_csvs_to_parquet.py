@@ -0,0 +1,66 @@
+import pandas as pd
+from pathlib import Path
+import sys
+
+
+def setup_paths():
+    # Try assuming we're in project/scripts
+    base_dir = Path.cwd().parent.parent / "data"
+    if not base_dir.exists():
+        # Fallback to current directory
+        base_dir = Path.cwd() / "data"
+
+    return base_dir
+
+
+def convert_county_names(csv_path, parquet_path):
+    """Write the county names table as Parquet with zero-padded FIPS strings."""
+    counties = pd.read_csv(csv_path, dtype={"COUNTY_FIPS": str})
+
+    # Pad once here so the dashboard can use the codes as-is
+    counties["COUNTY_FIPS"] = counties["COUNTY_FIPS"].str.zfill(5)
+
+    counties.to_parquet(parquet_path, engine="pyarrow", index=False)
+    print(f"Wrote {len(counties)} counties to {parquet_path}")
+
+
+def convert_population_history(csv_path, parquet_path):
+    """Write the decennial population history as Parquet sorted by FIPS, so single-county reads can skip row groups."""
+    population = pd.read_csv(csv_path, dtype=str).sort_values("fips")
+
+    population.to_parquet(parquet_path, engine="pyarrow", index=False, row_group_size=256)
+    print(f"Wrote {len(population)} population history rows to {parquet_path}")
+
+
+def main():
+    base_dir = setup_paths()
+
+    conversions = [
+        (convert_county_names,
+         base_dir / "raw" / "county_names.csv",
+         base_dir / "raw" / "county_names.parquet"),
+        (convert_population_history,
+         base_dir / "decennial_county_population_data_1900_1990.csv",
+         base_dir / "decennial_county_population_data_1900_1990.parquet"),
+    ]
+
+    converted = 0
+    for convert, csv_path, parquet_path in conversions:
+        if not csv_path.exists():
+            print(f"File not found: {csv_path}")
+            continue
+
+        try:
+            convert(csv_path, parquet_path)
+            converted += 1
+        except Exception as e:
+            print(f"❌ Error converting {csv_path.name}: {e}")
+            return 1
+
+    if not converted:
+        print("Conversion process completed but no data was processed")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())